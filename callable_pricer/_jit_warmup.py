@@ -0,0 +1,49 @@
+"""Optional warm-up of the Numba kernels used by the manual engines.
+
+Each kernel is called once on tiny arrays with the same argument types as
+the engines use, so the (cached) machine code is compiled or loaded from
+``__pycache__`` up front instead of inside the first pricing call. Enabled by
+setting ``CALLABLE_PRICER_JIT=1`` before importing the pricer; a no-op when
+Numba is not installed.
+
+The parallel (prange) HW-LSMC kernels are left out: compiling or running them
+starts Numba's worker threads, after which :func:`utils.fork_pool` can no
+longer fork and the scenario / sweep pools run serially. They compile (or
+load from the cache) on the first HW_LSMC pricing instead, inside the
+workers when ``cfg.n_workers`` != 1.
+"""
+
+import numpy as np
+
+from .engines import base, bk_tree, cir_pde
+from .engines._jit import HAS_NUMBA
+
+
+def warmup():
+    """Compile the serial engine kernels for the argument types used in pricing."""
+    if not HAS_NUMBA:
+        return
+
+    # BK tree (float64 state prices, int64 node offsets)
+    n = 5
+    j_max = 2
+    f = np.full(n, 0.2)
+    js = np.arange(-j_max, j_max + 1)
+    k = np.zeros(n, dtype=np.int64)
+    out = np.empty(n)
+    bk_tree._solve_alpha(np.log(0.05), f, js, 0.01, 0.02, 0.99)
+    bk_tree._compute_w(f, np.float64(-3.0), js, 0.01, 0.02, out)
+    bk_tree._forward_step(f, f, k, f, f, f, out)
+    disc = np.ones((2, n))
+    bk_tree._backward_step(
+        f, k, f, f, f, disc[0], j_max, out,
+        np.float64(0.0), np.float64(100.0), np.bool_(True),
+    )
+
+    # CIR PDE (float64 tridiagonal operators)
+    cprime, inv_denom = cir_pde._thomas_factor(-f, 1.0 + 2.0 * f, -f)
+    cir_pde._thomas_solve(-f, cprime, inv_denom, f, out)
+    cir_pde._tridiag_matvec(f, f, f, f, out)
+
+    # Straight-bond closed form (float64 cashflows and spreads)
+    base.spread_prices(f, f, 0.1, 0.99, f[:3])
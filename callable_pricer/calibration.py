@@ -1,13 +1,127 @@
+import hashlib
+import json
+from pathlib import Path
+
+import numpy as np
 import QuantLib as ql
 from scipy import optimize
 
+from .utils import fork_pool
+
+
+# Conventions shared by every helper, built once
+_PERIOD_3M = ql.Period('3M')
+_PERIOD_1Y = ql.Period('1Y')
+_DC_30_360_USA = ql.Thirty360(ql.Thirty360.USA)
+_DC_ACT_360 = ql.Actual360()
+
+# CIR calibration inputs shared with the differential-evolution workers.
+# QuantLib objects cannot be pickled, so workers are forked after this is set
+# and read the helpers/curve from their copy of the module state.
+_CIR_CONTEXT = {}
+
+
+def _cir_model_residuals(x):
+    """Relative cap pricing errors (model - market) / market for CIR params ``x``."""
+    theta, kappa, sigma = x
+    m = ql.CoxIngersollRoss(float(_CIR_CONTEXT['r0']), float(theta), float(kappa), float(sigma))
+    e = ql.AnalyticCapFloorEngine(m, _CIR_CONTEXT['ts'])
+
+    res = []
+    for h in _CIR_CONTEXT['helpers']:
+        h.setPricingEngine(e)
+        mkt = h.marketValue()
+        if mkt > 1e-6:
+            res.append((h.modelValue() - mkt) / mkt)
+    return np.array(res)
+
+
+def _cir_loss(x):
+    """Cap-fit objective for CIR (theta, kappa, sigma) with a soft Feller penalty.
+
+    ``x`` may also be a (3, S) population (``vectorized=True`` in scipy's
+    differential evolution); a vector of S losses is then returned.
+    """
+    x = np.asarray(x)
+    if x.ndim == 2:
+        return np.array([_cir_loss(col) for col in x.T])
+
+    theta, kappa, sigma = x
+    if kappa <= 1e-3 or sigma <= 1e-3 or theta <= 1e-3:
+        return 1e9
+
+    # Feller penalty (soft)
+    penal = 0.0 if 2.0 * kappa * theta > sigma ** 2 else 1.0
+
+    try:
+        return float(np.sum(_cir_model_residuals(x) ** 2) + penal)
+    except Exception:
+        return 1e9
+
+
+def _cir_residuals(x):
+    """Residual vector for least squares: cap errors plus a Feller term.
+
+    The Feller term is 0 when 2*kappa*theta >= sigma^2 and grows smoothly to 1
+    as the condition is violated (a differentiable stand-in for the step
+    penalty used with differential evolution).
+    """
+    theta, kappa, sigma = x
+    feller = max(0.0, 1.0 - 2.0 * kappa * theta / sigma ** 2)
+    try:
+        res = _cir_model_residuals(x)
+    except Exception:
+        res = np.full(_CIR_CONTEXT['n_residuals'], 1e3)
+    return np.append(res, feller)
+
+
+# Modules whose code shapes the calibrated parameters (curve building and the
+# calibrations themselves); their source is part of the cache key.
+_CACHE_KEY_SOURCES = (Path(__file__), Path(__file__).with_name("market.py"))
+
+
+def calibration_cache_key(paths, val_date, settings=None):
+    """Key of everything a cached calibration depends on.
+
+    Hashes the input file bytes, the valuation date, ``settings`` (any
+    options passed to the calibrations, via ``repr``), the QuantLib version
+    and the source of the curve / calibration modules, so editing the code
+    or the options invalidates earlier entries.
+    """
+    h = hashlib.sha256(str(val_date.serialNumber()).encode())
+    h.update(repr(settings).encode())
+    h.update(ql.__version__.encode())
+    for path in (*paths, *_CACHE_KEY_SOURCES):
+        h.update(Path(path).read_bytes())
+    return h.hexdigest()[:16]
+
+
+def cached_calibration(cache_dir, key, name, calibrate):
+    """Return ``calibrate()``, memoized on disk as ``cache_dir/{key}_{name}.json``.
+
+    ``key`` should identify every input of the calibration (see
+    :func:`calibration_cache_key`); a missing or unreadable entry is
+    recomputed and rewritten.
+    """
+    path = Path(cache_dir) / f"{key}_{name}.json"
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        pass
+
+    params = calibrate()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(params))
+    return params
+
 
 class Calibrator:
     """Model calibrations used in the empirical comparison.
 
     The calibration routines are intentionally pragmatic:
     - Hull-White is calibrated to a set of swaptions with NORMAL vols.
-    - CIR is calibrated to a subset of cap vols (normal) via differential evolution.
+    - CIR is calibrated to a subset of cap vols (normal) via bounded least squares
+      (differential evolution is available as an option).
     - BK proxy uses Black-Karasinski calibrated to a small subset of swaptions
       after converting normal vol -> lognormal vol via a simple ATM conversion.
 
@@ -17,7 +131,15 @@ class Calibrator:
 
     def __init__(self, ts_handle):
         self.ts = ts_handle
-        self.idx = ql.USDLibor(ql.Period('3M'), self.ts)
+        self.idx = ql.USDLibor(_PERIOD_3M, self.ts)
+
+        # ATM forward swap rates by (expiry, tenor, evaluation date), reused
+        # across repeated calibrations on the same curve. The observer clears
+        # the cache whenever the handle is relinked or the linked curve
+        # notifies a change (e.g. a quote bump at any tenor).
+        self._atm_cache = {}
+        self._curve_observer = ql.Observer(self._atm_cache.clear)
+        self._curve_observer.registerWith(self.ts)
 
     def calibrate_hw(self, data):
         """Calibrate Hull-White (a, sigma) to NORMAL swaption vols.
@@ -49,9 +171,9 @@ class Calibrator:
                     ten,
                     ql.QuoteHandle(ql.SimpleQuote(float(vol))),
                     self.idx,
-                    ql.Period('1Y'),
-                    ql.Thirty360(ql.Thirty360.USA),
-                    ql.Actual360(),
+                    _PERIOD_1Y,
+                    _DC_30_360_USA,
+                    _DC_ACT_360,
                     self.ts,
                     ql.SwaptionHelper.RelativePriceError,
                     ql.nullDouble(),
@@ -74,7 +196,7 @@ class Calibrator:
         a, sigma = model.params()[0], model.params()[1]
         return {'a': float(a), 'sigma': float(sigma)}
 
-    def calibrate_cir(self, data):
+    def calibrate_cir(self, data, method='least_squares', workers=-1):
         """Calibrate CIR (theta, kappa, sigma) to cap vols.
 
         Notes
@@ -82,6 +204,13 @@ class Calibrator:
         This follows the validated prototype: we build a set of cap helpers and
         fit (theta, kappa, sigma) with a mild Feller penalty.
 
+        ``method`` selects the optimizer:
+        - 'least_squares' (default): trust-region reflective least squares on
+          the vector of relative cap errors (smooth, few model evaluations).
+        - 'de': the prototype's differential evolution. ``workers`` is then the
+          number of processes used to evaluate each generation (-1: all
+          cores, 1: serial).
+
         Returns
         -------
         dict
@@ -104,7 +233,7 @@ class Calibrator:
                     ql.QuoteHandle(ql.SimpleQuote(float(vol))),
                     self.idx,
                     ql.Annual,
-                    ql.Thirty360(ql.Thirty360.USA),
+                    _DC_30_360_USA,
                     True,
                     self.ts,
                     ql.CapHelper.RelativePriceError,
@@ -114,35 +243,23 @@ class Calibrator:
             except Exception:
                 continue
 
-        def loss(x):
-            theta, kappa, sigma = x
-            if kappa <= 1e-3 or sigma <= 1e-3 or theta <= 1e-3:
-                return 1e9
-
-            # Feller penalty (soft)
-            penal = 0.0 if 2.0 * kappa * theta > sigma ** 2 else 1.0
-
-            try:
-                m = ql.CoxIngersollRoss(float(r0), float(theta), float(kappa), float(sigma))
-                e = ql.AnalyticCapFloorEngine(m, self.ts)
-
-                err = 0.0
-                for h in helpers:
-                    h.setPricingEngine(e)
-                    mkt = h.marketValue()
-                    if mkt > 1e-6:
-                        err += ((h.modelValue() - mkt) / mkt) ** 2
-                return float(err + penal)
-            except Exception:
-                return 1e9
-
-        # Differential evolution (global-ish). Keep it light to stay runnable.
-        res = optimize.differential_evolution(
-            loss,
-            [(0.01, 0.15), (0.01, 1.0), (0.01, 0.2)],
-            seed=42,
-            maxiter=5,
-        )
+        bounds = [(0.01, 0.15), (0.01, 1.0), (0.01, 0.2)]
+        _CIR_CONTEXT.update({'r0': r0, 'ts': self.ts, 'helpers': helpers})
+        try:
+            if method == 'de':
+                res = self._cir_differential_evolution(bounds, workers)
+            else:
+                _CIR_CONTEXT['n_residuals'] = len(_cir_model_residuals([0.05, 0.1, 0.02]))
+                lower, upper = zip(*bounds)
+                res = optimize.least_squares(
+                    _cir_residuals,
+                    x0=[0.05, 0.1, 0.02],
+                    bounds=(lower, upper),
+                    method='trf',
+                    x_scale='jac',
+                )
+        finally:
+            _CIR_CONTEXT.clear()
 
         return {
             'theta': float(res.x[0]),
@@ -151,6 +268,30 @@ class Calibrator:
             'r0': float(r0),
         }
 
+    @staticmethod
+    def _cir_differential_evolution(bounds, workers):
+        """Differential evolution (global-ish) on ``_cir_loss``.
+
+        Kept light (5 generations) to stay runnable. The population of each
+        generation is evaluated in a forked pool or, serially, through one
+        vectorized call.
+        """
+        pool = fork_pool(workers)
+        try:
+            return optimize.differential_evolution(
+                _cir_loss,
+                bounds,
+                seed=42,
+                maxiter=5,
+                updating='deferred',
+                workers=pool.map if pool is not None else 1,
+                vectorized=pool is None,
+            )
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
     def calibrate_bk(self, data):
         """Calibrate a BK proxy via Black-Karasinski + tree swaption engine.
 
@@ -166,6 +307,7 @@ class Calibrator:
         model = ql.BlackKarasinski(self.ts)
         eng = ql.TreeSwaptionEngine(model, 10)
         swp_engine = ql.DiscountingSwapEngine(self.ts)
+        eval_serial = ql.Settings.instance().evaluationDate.serialNumber()
 
         helpers = []
         for exp, ten, vol in data:
@@ -176,9 +318,13 @@ class Calibrator:
                 if ten.length() != 5:
                     continue
 
-                swap = ql.MakeVanillaSwap(ten, self.idx, 0.03, exp)
-                swap.setPricingEngine(swp_engine)
-                atm = max(swap.fairRate(), 0.01)
+                key = (exp.length(), int(exp.units()), ten.length(), int(ten.units()), eval_serial)
+                atm = self._atm_cache.get(key)
+                if atm is None:
+                    swap = ql.MakeVanillaSwap(ten, self.idx, 0.03, exp)
+                    swap.setPricingEngine(swp_engine)
+                    atm = max(swap.fairRate(), 0.01)
+                    self._atm_cache[key] = atm
                 vol_ln = float(vol) / float(atm)
 
                 h = ql.SwaptionHelper(
@@ -186,9 +332,9 @@ class Calibrator:
                     ten,
                     ql.QuoteHandle(ql.SimpleQuote(vol_ln)),
                     self.idx,
-                    ql.Period('1Y'),
-                    ql.Thirty360(ql.Thirty360.USA),
-                    ql.Actual360(),
+                    _PERIOD_1Y,
+                    _DC_30_360_USA,
+                    _DC_ACT_360,
                     self.ts,
                     ql.SwaptionHelper.RelativePriceError,
                     ql.nullDouble(),
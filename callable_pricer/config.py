@@ -1,6 +1,8 @@
-import numpy as np
+import os
 import warnings
 
+import numpy as np
+
 
 class AppConfig:
     """Central configuration object.
@@ -42,6 +44,14 @@ class AppConfig:
         self.mc_paths = 50000
         self.mc_steps_year = 24  # ~quinzenal
         self.mc_seed = 12345
+        # Forward curve for the HW shift alpha(t): 0 queries the curve on every
+        # time step (exact); N > 0 uses a cubic spline through N anchors
+        # (fewer QuantLib calls, but smooths piecewise-constant forwards).
+        self.mc_forward_anchors = 0
+        # Paths per simulation batch (0 = all paths in one batch). Batches of
+        # ~10k keep the state array cache-resident; the regression is then
+        # fitted on the first batch only.
+        self.mc_batch_size = 0
 
         # ----------------
         # PDE (CIR)
@@ -59,17 +69,52 @@ class AppConfig:
         # ----------------
         self.bk_steps_year = 52  # semanal
 
+        # ----------------
+        # Calibration
+        # ----------------
+        # run_analysis reuses calibrated parameters from outputs/cache while the
+        # curve / vol CSVs, valuation date, calibration options, QuantLib
+        # version and curve / calibration code are unchanged.
+        self.calibration_cache = True
+
         # ----------------
         # QuantLib Tree engines (reference)
         # ----------------
         self.ql_grid_size = 128
 
+        # ----------------
+        # I/O
+        # ----------------
+        # Read CSV inputs with PyArrow when installed (falls back to pandas).
+        self.fast_io = False
+        # Tables written by the reports: 'csv' (default) or 'parquet' (pyarrow;
+        # written as CSV when pyarrow is missing).
+        self.report_format = "csv"
+
+        # ----------------
+        # Parallelism
+        # ----------------
+        # Worker processes for the scenarios and sensitivity sweeps (1 = serial,
+        # -1 = all CPUs). The pools fork, so they fall back to serial (with a
+        # warning) once a parallel HW_LSMC kernel has run in this process, e.g.
+        # an HW_LSMC pricing before the pool is created.
+        self.n_workers = 1
+
         # ----------------
         # Global flags
         # ----------------
         self.suppress_warnings = True
         self.numpy_seed = 42
 
+        # PRICER_TEST_FAST=1: coarse grids / few paths for quick test runs
+        if os.environ.get("PRICER_TEST_FAST") == "1":
+            self.mc_paths = 500
+            self.mc_steps_year = 12
+            self.pde_grid_size = 200
+            self.pde_steps_year = 25
+            self.bk_steps_year = 12
+            self.ql_grid_size = 32
+
     def apply_global_settings(self):
         """Apply global deterministic settings (warnings + RNG seed)."""
         if self.suppress_warnings:
@@ -0,0 +1,39 @@
+"""Optional Numba support for the manual engines.
+
+Numba compiles the scalar inner loops of the engines (tree scatter / rollback,
+tridiagonal sweeps, path-wise updates). When it is not installed, ``njit``
+degrades to a no-op decorator and ``prange`` to ``range``, so the engines
+still run in pure Python with identical results.
+"""
+
+try:
+    from numba import njit, prange
+
+    HAS_NUMBA = True
+except ImportError:  # pragma: no cover - depends on the environment
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+def parallel_threads_started():
+    """True once Numba has launched its parallel (prange) worker threads.
+
+    Forking after that point is unsafe: with the workqueue threading layer the
+    parent process hangs at interpreter exit.
+    """
+    if not HAS_NUMBA:
+        return False
+    try:
+        from numba.np.ufunc import parallel
+    except ImportError:  # pragma: no cover - numba internals moved
+        return False
+    return bool(getattr(parallel, "_is_initialized", False))
@@ -1,5 +1,12 @@
 import abc
 
+import numpy as np
+import QuantLib as ql
+from scipy.interpolate import CubicSpline
+
+from ..utils import DateUtils
+from ._jit import HAS_NUMBA, njit
+
 
 class PricingEngine(abc.ABC):
     """Abstract interface for manual engines.
@@ -14,3 +21,127 @@ class PricingEngine(abc.ABC):
     @abc.abstractmethod
     def price(self, ts_handle, bond_data, params, state_cache=None):
         raise NotImplementedError
+
+
+def build_cashflows(bond_data, time_dc, today, state_cache=None):
+    """Future coupon and call events of ``bond_data`` on the bond time axis.
+
+    The coupon schedule is built once and converted to year fractions from
+    ``today`` using ``time_dc``. Risk bumps reprice the same bond on the same
+    reference date, so the result is memoized in ``state_cache`` (if given).
+
+    Returns
+    -------
+    dict
+        - 'coupon_amt': fixed coupon per period (face * coupon_rate / ppy)
+        - 'face': principal
+        - 'cf_t': times of the schedule dates after ``today`` (np.ndarray)
+        - 'cf_dates': the corresponding QuantLib dates
+        - 'cf_is_mat': True where the schedule date is the maturity date
+        - 'call_t', 'call_price': future call times and prices (np.ndarray)
+        - 'call_dates': the corresponding QuantLib dates
+    """
+    period = DateUtils.ensure_period_fast(bond_data['coupon_frequency'])
+    key = (
+        str(bond_data['issue_date']),
+        str(bond_data['maturity_date']),
+        period.length(),
+        int(period.units()),
+        today.serialNumber(),
+    )
+    if state_cache is not None:
+        cached = state_cache.get('cashflows')
+        if cached is not None and cached['key'] == key:
+            return cached
+
+    face = float(bond_data['face'])
+    coupon_rate = float(bond_data['coupon_rate'])
+    payments_per_year = float(DateUtils.payments_per_year(bond_data['coupon_frequency']))
+
+    issue = DateUtils.to_ql_date(bond_data['issue_date'])
+    mat = DateUtils.to_ql_date(bond_data['maturity_date'])
+    sch = ql.Schedule(
+        issue,
+        mat,
+        period,
+        bond_data['calendar'],
+        bond_data['business_convention'],
+        bond_data['business_convention'],
+        bond_data['date_generation'],
+        bool(bond_data['end_of_month']),
+    )
+    future = [d for d in sch if d > today]
+
+    calls = []
+    for cd, price in bond_data.get('call_schedule', []):
+        qd = DateUtils.to_ql_date(cd)
+        if qd <= today:
+            continue
+        calls.append((qd, float(price)))
+
+    flows = {
+        'key': key,
+        'coupon_amt': face * coupon_rate / payments_per_year,
+        'face': face,
+        'cf_t': np.array([float(time_dc.yearFraction(today, d)) for d in future]),
+        'cf_dates': future,
+        'cf_is_mat': np.array([d == mat for d in future], dtype=bool),
+        'call_t': np.array([float(time_dc.yearFraction(today, qd)) for qd, _ in calls]),
+        'call_price': np.array([p for _, p in calls]),
+        'call_dates': [qd for qd, _ in calls],
+    }
+    if state_cache is not None:
+        state_cache['cashflows'] = flows
+    return flows
+
+
+def curve_discounts(ts_obj, times):
+    """Discount factors of ``ts_obj`` on a time grid, as a float64 array."""
+    return np.fromiter((ts_obj.discount(float(t)) for t in times), dtype=np.float64, count=len(times))
+
+
+@njit(cache=True)
+def spread_prices(cf_t, cf_pv, t_settle, settle_df, spreads):
+    """Settlement values of ``sum(cf_pv * exp(-s * cf_t))`` for each spread ``s``.
+
+    ``cf_pv`` are the cashflows discounted on the base curve; a continuous
+    zero spread ``s`` scales every discount factor by exp(-s * t), including
+    the settlement discount ``settle_df`` at ``t_settle``.
+    """
+    out = np.empty(spreads.size)
+    for i in range(spreads.size):
+        s = spreads[i]
+        pv = 0.0
+        for j in range(cf_t.size):
+            pv += cf_pv[j] * np.exp(-s * cf_t[j])
+        out[i] = pv / (settle_df * np.exp(-s * t_settle))
+    return out
+
+
+def _spread_prices_numpy(cf_t, cf_pv, t_settle, settle_df, spreads):
+    """Vectorized equivalent of ``spread_prices`` (used when Numba is absent)."""
+    pv = np.exp(-np.outer(spreads, cf_t)) @ cf_pv
+    return pv / (settle_df * np.exp(-spreads * t_settle))
+
+
+if not HAS_NUMBA:
+    spread_prices = _spread_prices_numpy
+
+
+def curve_forwards(ts_obj, times, h=0.001, n_anchors=0):
+    """Numerical instantaneous forwards f(t) ~ F(t, t+h) (continuous) on a grid.
+
+    With ``n_anchors > 0`` the curve is only queried on that many equally
+    spaced anchors and a cubic spline is evaluated on ``times``. This is an
+    approximation: curves bootstrapped with log-linear discounting have
+    piecewise-constant forwards, which a spline smooths over.
+    """
+    times = np.asarray(times, dtype=np.float64)
+    if 0 < n_anchors < len(times):
+        anchors = np.linspace(times[0], times[-1], int(n_anchors))
+        return CubicSpline(anchors, curve_forwards(ts_obj, anchors, h))(times)
+    return np.fromiter(
+        (ts_obj.forwardRate(float(t), float(t) + h, ql.Continuous, ql.NoFrequency).rate() for t in times),
+        dtype=np.float64,
+        count=len(times),
+    )
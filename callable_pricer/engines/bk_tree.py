@@ -1,8 +1,115 @@
+import math
+
 import numpy as np
 import QuantLib as ql
 from scipy import optimize
 
 from ..utils import DateUtils
+from ._jit import HAS_NUMBA, njit
+from .base import build_cashflows, curve_discounts
+
+# Default bond day count, built once (QuantLib objects are immutable)
+_DC_30_360_USA = ql.Thirty360(ql.Thirty360.USA)
+
+
+@njit(cache=True)
+def _solve_alpha(alpha0, Q_mask, js_mask, dx, dt, zc_i):
+    """Newton solve of sum_j Q_j exp(-exp(alpha + j*dx) * dt) = zc_i.
+
+    The objective is smooth and monotone in alpha, so a few Newton steps from
+    the previous alpha are enough. Returns NaN when the iteration does not
+    converge inside the brentq bracket; the caller then falls back to brentq.
+    """
+    alpha = alpha0
+    for _ in range(50):
+        u = np.exp(alpha + js_mask * dx)
+        e = Q_mask * np.exp(-u * dt)
+        f = np.sum(e) - zc_i
+        fp = -dt * np.sum(u * e)
+        if abs(fp) < 1e-14:
+            return np.nan
+        step = f / fp
+        alpha -= step
+        if not abs(alpha) < 12.0:
+            return np.nan
+        if abs(step) < 1e-12:
+            return alpha
+    return np.nan
+
+
+@njit(cache=True)
+def _compute_w(Q, alpha_i, js, dx, dt, w_out):
+    """w_out <- Q * exp(-exp(alpha_i + j*dx) * dt), written in place."""
+    for j in range(Q.shape[0]):
+        w_out[j] = Q[j] * math.exp(-math.exp(alpha_i + js[j] * dx) * dt)
+
+
+@njit(cache=True)
+def _forward_step(Q, w, k, pu, pm, pd, Q_n):
+    """Scatter the weighted state prices of step i onto the nodes of step i+1."""
+    n = Q.shape[0]
+    for j in range(n):
+        Q_n[j] = 0.0
+    for j in range(n):
+        if Q[j] <= 1e-16:
+            continue
+        kk = j + k[j]
+        if 0 <= kk < n:
+            Q_n[kk] += w[j] * pm[j]
+        if 0 <= kk + 1 < n:
+            Q_n[kk + 1] += w[j] * pu[j]
+        if 0 <= kk - 1 < n:
+            Q_n[kk - 1] += w[j] * pd[j]
+
+
+@njit(cache=True)
+def _backward_step(V, k, pu, pm, pd, disc, j_max, V_n, cpn, call_price, has_call):
+    """One rollback step: expectation, discounting, coupon and call obstacle.
+
+    ``disc`` holds the one-step discount factor of every node at this step.
+    """
+    for j in range(V_n.shape[0]):
+        V_n[j] = 0.0
+    for j in range(1, 2 * j_max):
+        kk = j + k[j]
+        if 0 < kk < 2 * j_max:
+            ev = pu[j] * V[kk + 1] + pm[j] * V[kk] + pd[j] * V[kk - 1]
+            val = ev * disc[j] + cpn
+            if has_call:
+                val = min(val, call_price + cpn)
+            V_n[j] = val
+
+
+def _compute_w_numpy(Q, alpha_i, js, dx, dt, w_out):
+    np.multiply(Q, np.exp(-np.exp(alpha_i + js * dx) * dt), out=w_out)
+
+
+def _backward_step_numpy(V, k, pu, pm, pd, disc, j_max, V_n, cpn, call_price, has_call):
+    """Vectorized equivalent of ``_backward_step`` (used when Numba is absent).
+
+    The per-node loop becomes three gathers and a weighted sum; nodes whose
+    branch would leave the grid are masked to zero, as in the loop version.
+    """
+    j = np.arange(1, 2 * j_max)
+    kk = j + k[1:-1]
+    valid = (kk > 0) & (kk < 2 * j_max)
+
+    up = np.take(V, kk + 1, mode='clip')
+    mid = np.take(V, kk, mode='clip')
+    dn = np.take(V, kk - 1, mode='clip')
+    ev = pu[1:-1] * up + pm[1:-1] * mid + pd[1:-1] * dn
+
+    val = ev * disc[1:-1] + cpn
+    if has_call:
+        val = np.minimum(val, call_price + cpn)
+
+    V_n[:] = 0.0
+    V_n[1:-1] = np.where(valid, val, 0.0)
+
+
+if not HAS_NUMBA:
+    _compute_w = _compute_w_numpy
+    _backward_step = _backward_step_numpy
 
 
 class BKManualTreeEngine:
@@ -25,6 +132,22 @@ class BKManualTreeEngine:
     def _payments_per_year(self, coupon_frequency):
         return DateUtils.payments_per_year(coupon_frequency)
 
+    def price_multi(self, ts_list, bond_data, params, state_cache=None):
+        """Price the bond under several curves (first one = base run).
+
+        The curves are priced in turn with a shared ``state_cache``, so the
+        tree geometry and the cashflow schedule are reused.
+
+        Returns
+        -------
+        (list of dirty prices, list of standard errors (zeros), state_cache)
+        """
+        dirty = []
+        for ts in ts_list:
+            value, state_cache = self.price(ts, bond_data, params, state_cache)
+            dirty.append(value)
+        return dirty, [0.0] * len(dirty), state_cache
+
     def price(self, ts, bond_data, params, state_cache=None):
         a = float(params['a'])
         sigma = float(params['sigma'])
@@ -33,7 +156,7 @@ class BKManualTreeEngine:
         today = ts.referenceDate()
         mat = DateUtils.to_ql_date(bond_data['maturity_date'])
 
-        time_dc = bond_data.get('bond_day_count') or ql.Thirty360(ql.Thirty360.USA)
+        time_dc = bond_data.get('bond_day_count') or _DC_30_360_USA
         T = float(time_dc.yearFraction(today, mat))
 
         # Cache geometry between bumps
@@ -55,107 +178,77 @@ class BKManualTreeEngine:
 
         alpha = np.zeros(N)
         js = np.arange(-j_max, j_max + 1)
-        zc = [float(ts_obj.discount((i + 1) * dt)) for i in range(N)]
+        zc = curve_discounts(ts_obj, (np.arange(N) + 1) * dt)
 
-        tree = []
-        for i in range(N - 1):
-            mu = -a * js * dx
-            k = np.round(mu * dt / dx).astype(int)
-            pu = 1.0 / 6.0 + 0.5 * ((mu * dt / dx - k) ** 2 + (mu * dt / dx - k))
-            pd = 1.0 / 6.0 + 0.5 * ((mu * dt / dx - k) ** 2 - (mu * dt / dx - k))
-            pm = 1.0 - pu - pd
-            tree.append((k, pu, pm, pd))
+        # Branching geometry does not depend on the time step
+        mu = -a * js * dx
+        k = np.round(mu * dt / dx).astype(np.int64)
+        pu = 1.0 / 6.0 + 0.5 * ((mu * dt / dx - k) ** 2 + (mu * dt / dx - k))
+        pd = 1.0 / 6.0 + 0.5 * ((mu * dt / dx - k) ** 2 - (mu * dt / dx - k))
+        pm = 1.0 - pu - pd
 
+        Q_n = np.zeros_like(Q)
+        w = np.empty_like(Q)
         for i in range(N - 1):
             mask = Q > 1e-16
             if not np.any(mask):
                 break
 
-            def obj(val):
-                return np.sum(Q[mask] * np.exp(-np.exp(val + js[mask] * dx) * dt)) - zc[i]
-
-            try:
-                alpha[i] = optimize.brentq(obj, -12.0, 12.0, xtol=1e-12)
-            except Exception:
-                alpha[i] = alpha[i - 1] if i > 0 else np.log(0.05)
-
-            k, pu, pm, pd = tree[i]
-            Q_n = np.zeros_like(Q)
-            w = Q * np.exp(-np.exp(alpha[i] + js * dx) * dt)
-
-            idx = np.where(mask)[0]
-            for j in idx:
-                kk = k[j]
-                if 0 <= j + kk < len(Q):
-                    Q_n[j + kk] += w[j] * pm[j]
-                if 0 <= j + kk + 1 < len(Q):
-                    Q_n[j + kk + 1] += w[j] * pu[j]
-                if 0 <= j + kk - 1 < len(Q):
-                    Q_n[j + kk - 1] += w[j] * pd[j]
-            Q = Q_n
+            Q_mask = Q[mask]
+            js_mask = js[mask]
+            alpha_prev = alpha[i - 1] if i > 0 else np.log(0.05)
+            alpha[i] = _solve_alpha(alpha_prev, Q_mask, js_mask, dx, dt, zc[i])
+
+            if not np.isfinite(alpha[i]):
+                def obj(val):
+                    return np.sum(Q_mask * np.exp(-np.exp(val + js_mask * dx) * dt)) - zc[i]
+
+                try:
+                    alpha[i] = optimize.brentq(obj, -12.0, 12.0, xtol=1e-12)
+                except Exception:
+                    alpha[i] = alpha_prev
+
+            _compute_w(Q, alpha[i], js, dx, dt, w)
+            _forward_step(Q, w, k, pu, pm, pd, Q_n)
+            Q, Q_n = Q_n, Q
 
         # -----------------------------
         # Cashflows and call schedule
         # -----------------------------
-        face = float(bond_data['face'])
-        coupon_rate = float(bond_data['coupon_rate'])
-        payments_per_year = float(self._payments_per_year(bond_data['coupon_frequency']))
-        coupon_amt = face * coupon_rate / payments_per_year
-        
-        issue = DateUtils.to_ql_date(bond_data['issue_date'])
-        period = DateUtils.ensure_period(bond_data['coupon_frequency'])
-        sch = ql.Schedule(
-            issue,
-            mat,
-            period,
-            bond_data['calendar'],
-            bond_data['business_convention'],
-            bond_data['business_convention'],
-            bond_data['date_generation'],
-            bool(bond_data['end_of_month']),
-        )
-
-        cfs = {}
-        for d in sch:
-            if d > today:
-                idx = int(round(float(time_dc.yearFraction(today, d)) / dt))
-                amt = coupon_amt + (face if d == mat else 0.0)
-                cfs[idx] = cfs.get(idx, 0.0) + float(amt)
-
-        calls = {}
-        for cd, price in bond_data.get('call_schedule', []):
-            qd = DateUtils.to_ql_date(cd)
-            if qd <= today:
-                continue
-            idx = int(round(float(time_dc.yearFraction(today, qd)) / dt))
-            calls[idx] = float(price)
+        flows = build_cashflows(bond_data, time_dc, today, state_cache)
+        cf_amt = flows['coupon_amt'] + flows['face'] * flows['cf_is_mat']
+
+        # Dense per-step arrays so the rollback kernel avoids dict lookups
+        cfs = np.zeros(N)
+        for t, amt in zip(flows['cf_t'], cf_amt):
+            idx = int(round(t / dt))
+            if 0 <= idx < N:
+                cfs[idx] += amt
+
+        calls = np.zeros(N)
+        has_call = np.zeros(N, dtype=np.bool_)
+        for t, price in zip(flows['call_t'], flows['call_price']):
+            idx = int(round(t / dt))
+            if 0 <= idx < N:
+                calls[idx] = price
+                has_call[idx] = True
 
         # -----------------------------
         # Backward induction
         # -----------------------------
         V = np.zeros(2 * j_max + 1)
-        if (N - 1) in cfs:
-            V[:] = cfs[N - 1]
-
-        for i in range(len(tree) - 1, -1, -1):
-            k, pu, pm, pd = tree[i]
-            V_n = np.zeros_like(V)
-
-            # Loop version is kept for safety (variable k per node)
-            for j in range(1, 2 * j_max):
-                kk = k[j]
-                if 0 < j + kk < 2 * j_max:
-                    ev = pu[j] * V[j + kk + 1] + pm[j] * V[j + kk] + pd[j] * V[j + kk - 1]
-                    disc = np.exp(-np.exp(alpha[i] + (j - j_max) * dx) * dt)
-                    val = ev * disc
-
-                    if i in cfs:
-                        val += cfs[i]
-                    if i in calls:
-                        val = min(val, calls[i] + cfs.get(i, 0.0))
-
-                    V_n[j] = val
-
-            V = V_n
+        V[:] = cfs[N - 1]
+
+        # alpha is fixed once the forward pass is done, so the one-step
+        # discount factors of every node are computed in a single pass
+        disc_mat = np.exp(-np.exp(alpha[:, None] + js[None, :] * dx) * dt)
+
+        V_n = np.zeros_like(V)
+        for i in range(N - 2, -1, -1):
+            _backward_step(
+                V, k, pu, pm, pd, disc_mat[i], j_max,
+                V_n, cfs[i], calls[i], has_call[i],
+            )
+            V, V_n = V_n, V
 
         return float(V[j_max]), state_cache
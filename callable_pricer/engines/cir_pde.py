@@ -1,9 +1,82 @@
 import numpy as np
 import QuantLib as ql
-from scipy import sparse
-from scipy.sparse.linalg import splu
+from scipy.linalg.lapack import dgttrf, dgttrs
 
 from ..utils import DateUtils
+from ._jit import HAS_NUMBA, njit
+from .base import build_cashflows
+
+# Default bond day count, built once (QuantLib objects are immutable)
+_DC_30_360_USA = ql.Thirty360(ql.Thirty360.USA)
+
+
+@njit(cache=True)
+def _thomas_factor(A, B, C):
+    """Forward-sweep coefficients of the Thomas algorithm (time-independent)."""
+    n = B.shape[0]
+    cprime = np.empty(n)
+    inv_denom = np.empty(n)
+    inv_denom[0] = 1.0 / B[0]
+    cprime[0] = C[0] * inv_denom[0]
+    for i in range(1, n):
+        inv_denom[i] = 1.0 / (B[i] - A[i] * cprime[i - 1])
+        cprime[i] = C[i] * inv_denom[i]
+    return cprime, inv_denom
+
+
+@njit(cache=True)
+def _thomas_solve(A, cprime, inv_denom, d, out):
+    """Solve the factored tridiagonal system for the right-hand side ``d``."""
+    n = d.shape[0]
+    out[0] = d[0] * inv_denom[0]
+    for i in range(1, n):
+        out[i] = (d[i] - A[i] * out[i - 1]) * inv_denom[i]
+    for i in range(n - 2, -1, -1):
+        out[i] -= cprime[i] * out[i + 1]
+
+
+@njit(cache=True)
+def _tridiag_matvec(R_sub, R_main, R_sup, V, out):
+    """out = M_R @ V for the tridiagonal explicit operator."""
+    n = V.shape[0]
+    out[0] = R_main[0] * V[0] + R_sup[0] * V[1]
+    for i in range(1, n - 1):
+        out[i] = R_sub[i] * V[i - 1] + R_main[i] * V[i] + R_sup[i] * V[i + 1]
+    out[n - 1] = R_sub[n - 1] * V[n - 2] + R_main[n - 1] * V[n - 1]
+
+
+def _build_stepper(A, B, C, R_sub, R_main, R_sup):
+    """Return ``step(V, out)`` computing one Crank-Nicolson step M_L^-1 M_R V.
+
+    With Numba the implicit side is a hand-rolled Thomas solve (factored once)
+    plus a fused tridiagonal matvec. Without it, M_L is LU-factored once with
+    LAPACK ``dgttrf`` and each step is a vectorized matvec plus ``dgttrs``.
+    """
+    if HAS_NUMBA:
+        cprime, inv_denom = _thomas_factor(A, B, C)
+        rhs = np.empty_like(B)
+
+        def step(V, out):
+            _tridiag_matvec(R_sub, R_main, R_sup, V, rhs)
+            _thomas_solve(A, cprime, inv_denom, rhs, out)
+            return out
+
+        return step
+
+    dl, d, du, du2, ipiv, info = dgttrf(A[1:], B, C[:-1])
+    if info != 0:
+        raise np.linalg.LinAlgError(f"dgttrf failed for the PDE operator (info={info})")
+    rhs = np.empty_like(B)
+
+    def step(V, out):
+        np.multiply(R_main, V, out=rhs)
+        rhs[1:] += R_sub[1:] * V[:-1]
+        rhs[:-1] += R_sup[:-1] * V[1:]
+        x, _ = dgttrs(dl, d, du, du2, ipiv, rhs)
+        out[:] = x
+        return out
+
+    return step
 
 
 class CIRPDEEngine:
@@ -32,6 +105,24 @@ class CIRPDEEngine:
     def _payments_per_year(self, coupon_frequency):
         return DateUtils.payments_per_year(coupon_frequency)
 
+    def price_multi(self, ts_list, bond_data, params, state_cache=None):
+        """Price the bond under several curves (first one = base run).
+
+        The curves are priced in turn with a shared ``state_cache``, so the
+        cashflow schedule, the base-run r0 (for the theta shift), the grid and
+        the diffusion part of the operators are reused; the drift terms and
+        the M_L factorization only when theta does not move with the curve.
+
+        Returns
+        -------
+        (list of dirty prices, list of standard errors (zeros), state_cache)
+        """
+        dirty = []
+        for ts in ts_list:
+            value, state_cache = self.price(ts, bond_data, params, state_cache)
+            dirty.append(value)
+        return dirty, [0.0] * len(dirty), state_cache
+
     def price(self, ts, bond_data, params, state_cache=None):
         theta_base = float(params['theta'])
         k = float(params['k'])
@@ -52,13 +143,9 @@ class CIRPDEEngine:
         else:
             theta = theta_base
 
-        # Spatial grid
-        r = np.linspace(float(self.cfg.pde_r_min), float(self.cfg.pde_r_max), int(self.cfg.pde_grid_size))
-        dr = float(r[1] - r[0])
-
         today = ts.referenceDate()
         mat = DateUtils.to_ql_date(bond_data['maturity_date'])
-        time_dc = bond_data.get('bond_day_count', ql.Thirty360(ql.Thirty360.USA))
+        time_dc = bond_data.get('bond_day_count') or _DC_30_360_USA
         T = float(time_dc.yearFraction(today, mat))
 
         Nt = int(T * int(self.cfg.pde_steps_year))
@@ -66,91 +153,104 @@ class CIRPDEEngine:
             Nt = 3
         dt = T / Nt
 
-        # CIR coefficients
-        drift = k * (theta - r)
-        diff = 0.5 * (sigma ** 2) * r
+        # Spatial grid and the theta-independent (diffusion / discounting)
+        # part of the operators, shared by the base and bumped runs
+        r_min = float(self.cfg.pde_r_min)
+        r_max = float(self.cfg.pde_r_max)
+        n_r = int(self.cfg.pde_grid_size)
+        grid_key = (k, sigma, r_min, r_max, n_r, dt, Nt)
+        grid = state_cache.get('pde_grid')
+        if grid is None or grid[0] != grid_key:
+            r = np.linspace(r_min, r_max, n_r)
+            dr = float(r[1] - r[0])
+            diff = 0.5 * (sigma ** 2) * r
+            d_over_dr2 = diff * (1.0 / (dr * dr))
+            rpd = r + d_over_dr2
+            grid = (grid_key, r, dr, d_over_dr2, 1.0 + 0.5 * dt * rpd, 1.0 - 0.5 * dt * rpd)
+            state_cache['pde_grid'] = grid
+        _, r, dr, d_over_dr2, B_diff, R_main = grid
 
-        # Crank-Nicolson discretization (prototype form)
-        A = -0.25 * dt * (diff / dr ** 2 - drift / (2.0 * dr))
-        B = 1.0 + 0.5 * dt * (r + diff / dr ** 2)
-        C = -0.25 * dt * (diff / dr ** 2 + drift / (2.0 * dr))
+        # Drift terms and the M_L factorization depend on theta: reused as long
+        # as theta is unchanged (every call when pde_shift_theta_with_curve is
+        # off), rebuilt from the cached diffusion part otherwise
+        stepper = state_cache.get('pde_stepper')
+        if stepper is None or stepper[0] != (grid_key, theta):
+            # Crank-Nicolson discretization (prototype form)
+            drift_over_2dr = k * (theta - r) * (0.5 / dr)
+            A = -0.25 * dt * (d_over_dr2 - drift_over_2dr)
+            B = B_diff.copy()
+            C = -0.25 * dt * (d_over_dr2 + drift_over_2dr)
 
-        R_sub = 0.25 * dt * (diff / dr ** 2 - drift / (2.0 * dr))
-        R_main = 1.0 - 0.5 * dt * (r + diff / dr ** 2)
-        R_sup = 0.25 * dt * (diff / dr ** 2 + drift / (2.0 * dr))
+            R_sub = -A
+            R_sup = -C
 
-        # Boundary at r_min: reflecting-like adjustment (prototype)
-        B[0] += 2.0 * A[0]
-        C[0] -= A[0]
-        A[0] = 0.0
+            # Boundary at r_min: reflecting-like adjustment (prototype)
+            B[0] += 2.0 * A[0]
+            C[0] -= A[0]
+            A[0] = 0.0
 
-        M_L = sparse.diags([A[1:], B, C[:-1]], [-1, 0, 1], format='csc')
-        M_R = sparse.diags([R_sub[1:], R_main, R_sup[:-1]], [-1, 0, 1], format='csc')
-        solver = splu(M_L)
+            stepper = ((grid_key, theta), _build_stepper(A, B, C, R_sub, R_main, R_sup))
+            state_cache['pde_stepper'] = stepper
+        step = stepper[1]
 
         # -----------------------------
         # Cashflows and call schedule
         # -----------------------------
-        face = float(bond_data['face'])
-        coupon_rate = float(bond_data['coupon_rate'])
-        payments_per_year = float(self._payments_per_year(bond_data['coupon_frequency']))
-        coupon_amt = face * coupon_rate / payments_per_year
+        flows = build_cashflows(bond_data, time_dc, today, state_cache)
+        coupon_amt = float(flows['coupon_amt'])
 
         # Terminal condition: principal + last coupon
-        V = np.full_like(r, face + coupon_amt, dtype=float)
-
-        issue = DateUtils.to_ql_date(bond_data['issue_date'])
-        period = DateUtils.ensure_period(bond_data['coupon_frequency'])
-        sch = ql.Schedule(
-            issue,
-            mat,
-            period,
-            bond_data['calendar'],
-            bond_data['business_convention'],
-            bond_data['business_convention'],
-            bond_data['date_generation'],
-            bool(bond_data['end_of_month']),
-        )
+        V = np.full_like(r, flows['face'] + coupon_amt, dtype=float)
 
         # Coupons before maturity (coupon-only)
-        cfs = []
-        for d in sch:
-            if d > today and d < mat:
-                cfs.append((float(time_dc.yearFraction(today, d)), float(coupon_amt)))
+        cfs = [
+            (float(t), coupon_amt)
+            for t, d in zip(flows['cf_t'], flows['cf_dates'])
+            if d < mat
+        ]
 
         # Bermudan call dates
-        call_events = []
-        for cd, price in bond_data.get('call_schedule', []):
-            qd = DateUtils.to_ql_date(cd)
-            if qd <= today:
-                continue
-            call_events.append((float(time_dc.yearFraction(today, qd)), float(price)))
+        call_events = [(float(t), float(p)) for t, p in zip(flows['call_t'], flows['call_price'])]
 
         # -----------------------------
         # Backward solve in time
         # -----------------------------
-        curr_t = T
-        for _ in range(Nt):
-            prev_t = curr_t
-            curr_t -= dt
-
-            V = solver.solve(M_R @ V)
-
-            # Coupon jumps
-            for ct, amt in cfs:
-                if curr_t <= ct < prev_t:
-                    V += amt
-
-            # Call obstacle (applied only on call dates)
-            for ct, call_price in call_events:
-                if curr_t <= ct < prev_t:
-                    # coupon at the call date (if aligned)
-                    cpn = 0.0
-                    for cft, amt in cfs:
-                        if abs(cft - ct) < dt * 2.0:
-                            cpn = amt
-                            break
-                    V = np.minimum(V, call_price + cpn)
+        # Events are bucketed by step beforehand: step i covers the interval
+        # [times[i+1], times[i]) of the (sequentially decremented) time grid.
+        times = np.subtract.accumulate(np.r_[T, np.full(Nt, dt)])
+
+        def _step_of(ct):
+            hit = np.flatnonzero((times[1:] <= ct) & (ct < times[:-1]))
+            return int(hit[0]) if hit.size else None
+
+        # Coupon jumps
+        cf_per_step = np.zeros(Nt)
+        for ct, amt in cfs:
+            i = _step_of(ct)
+            if i is not None:
+                cf_per_step[i] += amt
+
+        # Call obstacle (applied only on call dates): call price + coupon at the
+        # call date (if aligned)
+        call_per_step = np.full(Nt, np.inf)
+        for ct, call_price in call_events:
+            i = _step_of(ct)
+            if i is None:
+                continue
+            cpn = 0.0
+            for cft, amt in cfs:
+                if abs(cft - ct) < dt * 2.0:
+                    cpn = amt
+                    break
+            call_per_step[i] = min(call_per_step[i], call_price + cpn)
+
+        V_new = np.empty_like(V)
+        for i in range(Nt):
+            V, V_new = step(V, V_new), V
+            if cf_per_step[i] != 0.0:
+                V += cf_per_step[i]
+            if call_per_step[i] < np.inf:
+                np.minimum(V, call_per_step[i], out=V)
 
         price = float(np.interp(r0, r, V))
         return price, state_cache
@@ -1,7 +1,100 @@
+import math
+
 import numpy as np
 import QuantLib as ql
 
 from ..utils import DateUtils
+from ._jit import HAS_NUMBA, njit, prange
+from .base import build_cashflows, curve_forwards
+
+# Default bond day count, built once (QuantLib objects are immutable)
+_DC_30_360_USA = ql.Thirty360(ql.Thirty360.USA)
+
+
+@njit(parallel=True, cache=True)
+def _discount_step(V, X_i, alpha_i, dt, curr_amt):
+    """V <- V * exp(-(X_i + alpha_i) * dt) + curr_amt, path by path."""
+    for p in prange(V.shape[0]):
+        V[p] = V[p] * math.exp(-(X_i[p] + alpha_i) * dt) + curr_amt
+
+
+@njit(parallel=True, cache=True)
+def _exercise_step(V, X_next, betas, strike, curr_amt):
+    """Apply the Bermudan call where the regressed continuation value exceeds
+    the strike. Returns the number of exercised paths."""
+    n_ex = 0
+    for p in prange(V.shape[0]):
+        x = np.float64(X_next[p])
+        cont_val = betas[0] + betas[1] * x + betas[2] * x * x
+        if cont_val - curr_amt > strike:
+            V[p] = strike + curr_amt
+            n_ex += 1
+    return n_ex
+
+
+@njit(parallel=True, cache=True)
+def _regression_moments(X_next, V):
+    """Moments for the normal equations of the quadratic basis [1, X, X^2].
+
+    Returns (S, b) with S[m, n] = sum X^(m+n) and b[m] = sum X^m V, computed in
+    a single pass over the paths.
+    """
+    s1 = 0.0
+    s2 = 0.0
+    s3 = 0.0
+    s4 = 0.0
+    v0 = 0.0
+    v1 = 0.0
+    v2 = 0.0
+    for p in prange(V.shape[0]):
+        x = np.float64(X_next[p])
+        x2 = x * x
+        s1 += x
+        s2 += x2
+        s3 += x2 * x
+        s4 += x2 * x2
+        v0 += V[p]
+        v1 += x * V[p]
+        v2 += x2 * V[p]
+    S = np.array([
+        [float(V.shape[0]), s1, s2],
+        [s1, s2, s3],
+        [s2, s3, s4],
+    ])
+    b = np.array([v0, v1, v2])
+    return S, b
+
+
+def _discount_step_numpy(V, X_i, alpha_i, dt, curr_amt):
+    V *= np.exp(-(X_i + np.float64(alpha_i)) * dt)
+    V += curr_amt
+
+
+def _regression_moments_numpy(X_next, V):
+    X_next = X_next.astype(np.float64)
+    x2 = X_next * X_next
+    s1, s2, s3, s4 = X_next.sum(), x2.sum(), (x2 * X_next).sum(), (x2 * x2).sum()
+    S = np.array([
+        [float(V.shape[0]), s1, s2],
+        [s1, s2, s3],
+        [s2, s3, s4],
+    ])
+    b = np.array([V.sum(), X_next @ V, x2 @ V])
+    return S, b
+
+
+def _exercise_step_numpy(V, X_next, betas, strike, curr_amt):
+    X_next = X_next.astype(np.float64)
+    cont_val = betas[0] + betas[1] * X_next + betas[2] * X_next * X_next
+    exercise = (cont_val - curr_amt) > strike
+    V[exercise] = strike + curr_amt
+    return int(np.count_nonzero(exercise))
+
+
+if not HAS_NUMBA:
+    _discount_step = _discount_step_numpy
+    _exercise_step = _exercise_step_numpy
+    _regression_moments = _regression_moments_numpy
 
 
 class HullWhiteLSMCEngine:
@@ -36,11 +129,26 @@ class HullWhiteLSMCEngine:
         return DateUtils.payments_per_year(coupon_frequency)
 
     def price(self, ts, bond_data, params, state_cache=None):
+        dirty, std, state_cache = self.price_multi([ts], bond_data, params, state_cache)
+        return dirty[0], std[0], state_cache
+
+    def price_multi(self, ts_list, bond_data, params, state_cache=None):
+        """Price the bond under several curves sharing one set of paths.
+
+        The curves (e.g. base / bumped up / bumped down) only move the shift
+        alpha(t), so the OU state X is simulated once per batch and rolled
+        back once per curve. The first curve plays the role of the base run
+        (regression fit and exercise diagnostics), exactly as if the curves
+        were priced one after the other with the same ``state_cache``.
+
+        Returns
+        -------
+        (list of dirty prices, list of standard errors, state_cache)
+        """
         a = float(params['a'])
         sigma = float(params['sigma'])
 
-        ts_obj = ts.currentLink()
-        today = ts.referenceDate()
+        today = ts_list[0].referenceDate()
         mat = DateUtils.to_ql_date(bond_data['maturity_date'])
 
         # Time axis: use the bond day count (e.g., 30/360) so cashflow times and
@@ -49,7 +157,7 @@ class HullWhiteLSMCEngine:
         # Note: the SOFR curve itself is Act/360; the time grid here is an
         # approximation consistent with the validated prototype used in the
         # dissertation.
-        time_dc = bond_data.get('bond_day_count', ql.Thirty360(ql.Thirty360.USA))
+        time_dc = bond_data.get('bond_day_count') or _DC_30_360_USA
         T = float(time_dc.yearFraction(today, mat))
 
         N = int(T * int(self.cfg.mc_steps_year))
@@ -60,8 +168,11 @@ class HullWhiteLSMCEngine:
         # -----------------------------
         # 1) Common Random Numbers (CRN)
         # -----------------------------
+        # Draws are float32 and time-major, shape (N, n_paths): half the memory
+        # of float64 and contiguous per step, which is all the simulation needs.
         if state_cache is None:
-            rng = np.random.RandomState(int(self.cfg.mc_seed)).normal(0.0, 1.0, (int(self.cfg.mc_paths), N))
+            gen = np.random.default_rng(int(self.cfg.mc_seed))
+            rng = gen.standard_normal((N, int(self.cfg.mc_paths)), dtype=np.float32)
             state_cache = {
                 'rng': rng,
                 'regressions': {},
@@ -69,127 +180,148 @@ class HullWhiteLSMCEngine:
             }
         rng = state_cache['rng']
 
-        n_paths = rng.shape[0]
-
-        # -----------------------------
-        # 2) Simulate OU state X
-        # -----------------------------
-        X = np.zeros((n_paths, N + 1))
-        if abs(a) < 1e-12:
-            # a ~ 0 degenerates to Brownian driftless short-rate model
-            for i in range(N):
-                X[:, i + 1] = X[:, i] + sigma * np.sqrt(dt) * rng[:, i]
-        else:
-            for i in range(N):
-                X[:, i + 1] = X[:, i] * (1.0 - a * dt) + sigma * np.sqrt(dt) * rng[:, i]
+        n_paths = rng.shape[1]
 
         # -----------------------------
-        # 3) Shift alpha(t) to match the input curve
+        # 2) Shift alpha(t) to match the input curve
         # -----------------------------
         t_grid = np.linspace(0.0, T, N + 1)
-        alpha = np.zeros(N + 1)
-        for i, t in enumerate(t_grid):
-            # Numerical forward rate from the term structure
-            fwd = ts_obj.forwardRate(float(t), float(t) + 0.001, ql.Continuous, ql.NoFrequency).rate()
-
-            if abs(a) > 1e-5:
-                var = (sigma ** 2 / (2.0 * a ** 2)) * (1.0 - np.exp(-a * t)) ** 2
-            else:
-                var = 0.5 * (sigma ** 2) * (t ** 2)
-            alpha[i] = float(fwd) + float(var)
-
-        # Short rate along each path
-        R = X + alpha
+        if abs(a) > 1e-5:
+            var = (sigma ** 2 / (2.0 * a ** 2)) * (1.0 - np.exp(-a * t_grid)) ** 2
+        else:
+            var = 0.5 * (sigma ** 2) * (t_grid ** 2)
+        # Numerical forward rates from each term structure, fetched in one pass
+        n_anchors = int(getattr(self.cfg, 'mc_forward_anchors', 0))
+        alphas = [curve_forwards(ts.currentLink(), t_grid, n_anchors=n_anchors) + var for ts in ts_list]
 
         # -----------------------------
-        # 4) Build cashflow and call times
+        # 3) Build cashflow and call times
         # -----------------------------
-        face = float(bond_data['face'])
-        coupon_rate = float(bond_data['coupon_rate'])
-        payments_per_year = float(self._payments_per_year(bond_data['coupon_frequency']))
-        coupon_amt = face * coupon_rate / payments_per_year
-
-        issue = DateUtils.to_ql_date(bond_data['issue_date'])
-        period = DateUtils.ensure_period(bond_data['coupon_frequency'])
-        sch = ql.Schedule(
-            issue,
-            mat,
-            period,
-            bond_data['calendar'],
-            bond_data['business_convention'],
-            bond_data['business_convention'],
-            bond_data['date_generation'],
-            bool(bond_data['end_of_month']),
-        )
+        flows = build_cashflows(bond_data, time_dc, today, state_cache)
 
         # Cashflows list: (time, amount). Amount includes principal at maturity.
-        cfs = []
-        for d in sch:
-            if d > today:
-                amt = coupon_amt
-                if d == mat:
-                    amt += face
-                cfs.append((float(time_dc.yearFraction(today, d)), float(amt)))
+        cf_amt = flows['coupon_amt'] + flows['face'] * flows['cf_is_mat']
+        cfs = [(float(t), float(amt)) for t, amt in zip(flows['cf_t'], cf_amt)]
 
         # Map call events to steps using the same discretization spirit as the prototype.
         call_step_to_price = {}
         call_step_to_date = {}
-        for cd, price in bond_data.get('call_schedule', []):
-            qd = DateUtils.to_ql_date(cd)
-            if qd <= today:
-                continue
-            t_call = float(time_dc.yearFraction(today, qd))
+        for t_call, price, qd in zip(flows['call_t'], flows['call_price'], flows['call_dates']):
             step = int(round(t_call / dt))
             step = max(1, min(step, N))
             call_step_to_price[step] = float(price)
             call_step_to_date[step] = qd
 
         # -----------------------------
-        # 5) Backward induction with LSMC
+        # 4) Simulate and roll back, one batch of paths at a time
         # -----------------------------
-        V = np.zeros(n_paths)
+        # Each batch runs the full simulation + backward induction on its own
+        # slice of the CRN draws, so only a (N+1, batch) state array is alive
+        # at a time. The regression betas are fitted on the first batch of the
+        # base run and reused by the other batches (and by every bumped run).
+        batch = int(getattr(self.cfg, 'mc_batch_size', 0))
+        if batch <= 0 or batch > n_paths:
+            batch = n_paths
+
         is_base_run = (len(state_cache.get('regressions', {})) == 0)
+        exercised = {}
+        v_sum = np.zeros(len(ts_list))
+        v_sq = np.zeros(len(ts_list))
+        for start in range(0, n_paths, batch):
+            X = self._simulate_state(rng[:, start:start + batch], a, sigma, dt)
+            for k, alpha in enumerate(alphas):
+                V = self._rollback(
+                    X, alpha, t_grid, dt, cfs, call_step_to_price, state_cache,
+                    fit=(is_base_run and start == 0 and k == 0),
+                    exercised=exercised if k == 0 else {},
+                )
+                v_sum[k] += float(V.sum())
+                v_sq[k] += float(V @ V)
+
+        # Optional diagnostics (does not affect the price)
+        if is_base_run:
+            for call_step, n_ex in exercised.items():
+                state_cache['exercise_prob'][str(call_step_to_date[call_step])] = n_ex / float(n_paths)
+
+        # Return Standard Error of the Mean (SEM) = std(V) / sqrt(N)
+        # This represents the statistical uncertainty of the estimated price.
+        mean = v_sum / n_paths
+        var = np.maximum(v_sq / n_paths - mean * mean, 0.0)
+        return mean.tolist(), np.sqrt(var / n_paths).tolist(), state_cache
+
+    @staticmethod
+    def _simulate_state(Z, a, sigma, dt):
+        """OU state X for a block of draws Z, shape (N, n) -> (N+1, n), float32.
+
+        The Euler recurrence X[i+1] = d * X[i] + sigma*sqrt(dt)*Z[i] with a
+        constant d = 1 - a*dt is solved in closed form with a single cumsum:
+        X[i] = d**i * sum_{k<i} sigma*sqrt(dt)*Z[k] / d**(k+1).
+        a ~ 0 degenerates to Brownian driftless short-rate model (d = 1).
+
+        X is stored time-major so that the per-step slices read in the
+        backward pass are contiguous.
+        """
+        N, n_paths = Z.shape
+        decay = 1.0 if abs(a) < 1e-12 else 1.0 - a * dt
+        # X is kept in float32 like the draws (ample for price and 10bp bumps).
+        vol_step = np.float32(sigma * np.sqrt(dt))
+        X = np.zeros((N + 1, n_paths), dtype=np.float32)
+        if decay > 0.0 and decay ** N > 1e-8:
+            pow_decay = (decay ** np.arange(1, N + 1)).astype(np.float32)
+            np.cumsum(Z * (vol_step / pow_decay)[:, None], axis=0, out=X[1:])
+            X[1:] *= pow_decay[:, None]
+        else:
+            # Strong mean reversion: rescaling would lose precision
+            for i in range(N):
+                X[i + 1] = X[i] * np.float32(decay) + vol_step * Z[i]
+        return X
+
+    @staticmethod
+    def _rollback(X, alpha, t_grid, dt, cfs, call_step_to_price, state_cache, fit, exercised):
+        """Backward induction with LSMC over one batch of paths.
+
+        The short rate along each path, r = X + alpha(t), is formed one column
+        at a time (no (N+1, n_paths) copy of X). With ``fit`` the regression
+        betas are estimated on this batch and stored in ``state_cache``;
+        otherwise the cached betas are used. Exercise counts are added to
+        ``exercised`` (keyed by call step).
+        """
+        N = X.shape[0] - 1
+        V = np.zeros(X.shape[1])
 
         for i in range(N - 1, -1, -1):
             t = t_grid[i]
             t_next = t_grid[i + 1]
 
-            # Discount one step using the short rate at the beginning of the interval
-            V *= np.exp(-R[:, i] * dt)
-
-            # Add any cashflows that happen in (t, t_next]
+            # Cashflows that happen in (t, t_next]
             curr_amt = 0.0
             for ct, amt in cfs:
                 if t < ct <= t_next:
-                    V += amt
                     curr_amt += amt
 
+            # Discount one step using the short rate at the beginning of the
+            # interval, then add the cashflows
+            _discount_step(V, X[i], float(alpha[i]), dt, curr_amt)
+
             # Call decision at t_next (Bermudan)
             call_step = i + 1
             if call_step in call_step_to_price:
                 strike = call_step_to_price[call_step]
+                X_next = X[i + 1]
 
-                # Quadratic basis in the *state* X (same as prototype)
-                basis = np.vstack([np.ones(n_paths), X[:, i + 1], X[:, i + 1] ** 2]).T
-
-                if is_base_run:
+                if fit:
+                    # Quadratic basis in the *state* X (same as prototype),
+                    # least squares solved through the 3x3 normal equations
+                    S, b = _regression_moments(X_next, V)
                     try:
-                        betas = np.linalg.lstsq(basis, V, rcond=None)[0]
+                        betas = np.linalg.solve(S, b)
                     except Exception:
                         betas = np.zeros(3)
                     state_cache['regressions'][i] = betas
                 else:
                     betas = state_cache['regressions'].get(i, np.zeros(3))
 
-                cont_val = basis @ betas
-                exercise = (cont_val - curr_amt) > strike
+                n_ex = _exercise_step(V, X_next, np.asarray(betas, dtype=np.float64), strike, curr_amt)
+                exercised[call_step] = exercised.get(call_step, 0) + n_ex
 
-                # Optional diagnostics (does not affect the price)
-                if is_base_run:
-                    state_cache['exercise_prob'][str(call_step_to_date[call_step])] = float(np.mean(exercise))
-
-                V = np.where(exercise, strike + curr_amt, V)
-
-        # Return Standard Error of the Mean (SEM) = std(V) / sqrt(N)
-        # This represents the statistical uncertainty of the estimated price.
-        return float(np.mean(V)), float(np.std(V) / np.sqrt(n_paths)), state_cache
+        return V
@@ -59,13 +59,35 @@ class CallableBondSpec:
         if self.call_schedule is None:
             self.call_schedule = []
 
+    def __setattr__(self, name, value):
+        # Any change to a field invalidates the memoized QuantLib objects
+        if not name.startswith("_"):
+            self.__dict__.pop("_ql_cache", None)
+        super().__setattr__(name, value)
+
+    def _memoized(self, key, build):
+        cache = self.__dict__.setdefault("_ql_cache", {})
+        if key not in cache:
+            cache[key] = build()
+        return cache[key]
+
     # ---------------------------------------------------------------------
     # QuantLib objects
     # ---------------------------------------------------------------------
+    # Built once and memoized until a field of the spec is reassigned.
     def ql_schedule(self):
+        return self._memoized("schedule", self._build_schedule)
+
+    def ql_straight_bond(self):
+        return self._memoized("straight", self._build_straight_bond)
+
+    def ql_callable_bond(self):
+        return self._memoized("callable", self._build_callable_bond)
+
+    def _build_schedule(self):
         issue = DateUtils.to_ql_date(self.issue_date)
         mat = DateUtils.to_ql_date(self.maturity_date)
-        period = DateUtils.ensure_period(self.coupon_frequency)
+        period = DateUtils.ensure_period_fast(self.coupon_frequency)
         return ql.Schedule(
             issue,
             mat,
@@ -77,7 +99,7 @@ class CallableBondSpec:
             bool(self.end_of_month),
         )
 
-    def ql_straight_bond(self):
+    def _build_straight_bond(self):
         sch = self.ql_schedule()
         issue = DateUtils.to_ql_date(self.issue_date)
         return ql.FixedRateBond(
@@ -91,20 +113,20 @@ class CallableBondSpec:
             issue,
         )
 
-    def ql_callable_bond(self):
+    def _build_callable_bond(self):
         sch = self.ql_schedule()
         issue = DateUtils.to_ql_date(self.issue_date)
 
-        callabilities = []
-        for d, price in self.call_schedule:
-            cd = DateUtils.to_ql_date(d)
-            callabilities.append(
-                ql.Callability(
-                    ql.BondPrice(float(price), ql.BondPrice.Clean),
-                    ql.Callability.Call,
-                    cd,
-                )
-            )
+        # Lookups hoisted out of the (possibly dense Bermudan) schedule
+        Callability = ql.Callability
+        BondPrice = ql.BondPrice
+        clean = ql.BondPrice.Clean
+        call = ql.Callability.Call
+        to_ql_date = DateUtils.to_ql_date
+        callabilities = [
+            Callability(BondPrice(float(price), clean), call, to_ql_date(d))
+            for d, price in self.call_schedule
+        ]
 
         return ql.CallableFixedRateBond(
             0,
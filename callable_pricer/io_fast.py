@@ -0,0 +1,42 @@
+"""Optional fast CSV ingestion.
+
+PyArrow's multithreaded CSV reader is several times faster than the default
+pandas parser on large curve / surface exports. It is used when installed and
+requested (``cfg.fast_io``); otherwise the pandas reader is used, and the
+returned DataFrame has the same columns and values either way.
+"""
+
+import pandas as pd
+
+try:
+    import pyarrow.csv as pacsv
+except ImportError:  # pragma: no cover - depends on the environment
+    pacsv = None
+
+
+def read_csv_fast(path, columns=None, parse_dates=None, dtype=None, use_arrow=True):
+    """Read a CSV into a pandas DataFrame, through PyArrow when available.
+
+    Parameters
+    ----------
+    path : str|Path
+        CSV path.
+    columns : list[str] or None
+        Subset of columns to read (None: all).
+    parse_dates : list[str] or None
+        Columns converted to ``datetime64``.
+    dtype : dict or None
+        Column dtypes, as in ``pandas.read_csv``.
+    use_arrow : bool
+        If False, always use the pandas reader.
+    """
+    if not use_arrow or pacsv is None:
+        return pd.read_csv(path, usecols=columns, parse_dates=parse_dates, dtype=dtype)
+
+    convert = pacsv.ConvertOptions(include_columns=list(columns) if columns else None)
+    df = pacsv.read_csv(str(path), convert_options=convert).to_pandas()
+    for col in parse_dates or []:
+        df[col] = pd.to_datetime(df[col])
+    if dtype:
+        df = df.astype(dtype)
+    return df
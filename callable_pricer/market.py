@@ -1,9 +1,38 @@
 import io
+
+import numpy as np
 import pandas as pd
 import QuantLib as ql
 
+from .io_fast import read_csv_fast
 from .utils import DateUtils, us_sofr_calendar
 
+# Default curve conventions (SOFR/OIS), built once
+_DEFAULT_DAY_COUNT = ql.Actual360()
+_DEFAULT_CALENDAR = us_sofr_calendar()
+
+
+def _detect_columns(path, predicates):
+    """Return, for each predicate, the first CSV header name it accepts.
+
+    Only the header row is read. Names with no match are returned as None.
+    """
+    columns = pd.read_csv(path, nrows=0).columns
+    return [next((c for c in columns if pred(c.lower())), None) for pred in predicates]
+
+
+def _try(func, value):
+    """``func(value)``, or None if it raises."""
+    try:
+        return func(value)
+    except Exception:
+        return None
+
+
+def _parse_strike(label):
+    """Strike header such as '1.50%' -> 0.015."""
+    return float(str(label).strip().replace("%", "")) / 100.0
+
 
 class MarketLoader:
     """Load market inputs (discount curve + volatility surfaces).
@@ -27,36 +56,38 @@ class MarketLoader:
         """
         # Business rule (per dissertation): SOFR/OIS discounting with
         # Act/360 and a United States calendar (SOFR if available).
-        day_count = day_count or ql.Actual360()
-        calendar = calendar or us_sofr_calendar()
-
-        df = pd.read_csv(path)
-        # Try to auto-detect columns
-        col_date = next(
-            (c for c in df.columns if "data" in c.lower() or "vertice" in c.lower()),
-            None,
-        )
-        col_df = next(
-            (c for c in df.columns if "fator" in c.lower() or "desconto" in c.lower()),
-            None,
-        )
+        day_count = day_count or _DEFAULT_DAY_COUNT
+        calendar = calendar or _DEFAULT_CALENDAR
+
+        # Try to auto-detect columns from the header, then parse only those
+        col_date, col_df = _detect_columns(path, [
+            lambda c: "data" in c or "vertice" in c,
+            lambda c: "fator" in c or "desconto" in c,
+        ])
         if col_date is None or col_df is None:
             raise ValueError(
                 "CSV da curva deve conter coluna de data (data/vertice) e coluna de fator de desconto (fator/desconto)."
             )
 
-        df[col_date] = pd.to_datetime(df[col_date])
+        df = read_csv_fast(
+            path,
+            columns=[col_date, col_df],
+            parse_dates=[col_date],
+            dtype={col_df: np.float64},
+            use_arrow=bool(getattr(self.cfg, "fast_io", False)),
+        )
         df = df.sort_values(col_date)
 
-        dates = [self.cfg.val_date]
-        dfs = [1.0]
+        # Keep only vertices strictly after the valuation date (compared on
+        # the calendar date, as QuantLib dates carry no time of day)
+        val_date = self.cfg.val_date
+        val_ts = pd.Timestamp(val_date.year(), val_date.month(), val_date.dayOfMonth())
+        mask = (df[col_date].dt.normalize() > val_ts).to_numpy()
+
+        dfs_np = df[col_df].to_numpy(dtype=np.float64)[mask]
 
-        for _, row in df.iterrows():
-            d = DateUtils.to_ql_date(row[col_date])
-            if d <= self.cfg.val_date:
-                continue
-            dates.append(d)
-            dfs.append(float(row[col_df]))
+        dates = [val_date] + DateUtils.to_ql_dates(df[col_date][mask])
+        dfs = [1.0] + dfs_np.tolist()
 
         curve = ql.DiscountCurve(dates, dfs, day_count, calendar)
         if allow_extrapolation:
@@ -80,30 +111,30 @@ class MarketLoader:
             - HW: list of (expiry_period, tenor_period, vol)
             - CIR: list of (tenor_period, strike, vol)
         """
-        df = pd.read_csv(path)
+        df = read_csv_fast(path, use_arrow=bool(getattr(self.cfg, "fast_io", False)))
         if df.empty:
             return []
 
-        df = df.copy()
-        df.set_index(df.columns[0], inplace=True)
-
-        data = []
-        for idx_row, row in df.iterrows():
-            for idx_col, val in row.items():
-                try:
-                    if pd.isna(val):
-                        continue
-                    t = DateUtils.parse_period(idx_row)
-
-                    if kind.upper() == "HW":
-                        ten = DateUtils.parse_period(idx_col)
-                        data.append((t, ten, float(val)))
-                    else:
-                        # CIR cap/floor surface: columns are strikes
-                        if "ATM" in str(idx_col).upper():
-                            continue
-                        s = float(str(idx_col).strip().replace("%", "")) / 100.0
-                        data.append((t, s, float(val)))
-                except Exception:
-                    continue
+        df = df.set_index(df.columns[0])
+
+        # One (row label, column label) -> vol entry per non-empty numeric cell
+        cells = pd.to_numeric(df.stack(), errors="coerce").dropna()
+
+        # Headers are parsed once per label; unparseable labels map to None
+        # and their cells are skipped
+        row_periods = {r: _try(DateUtils.parse_period, r) for r in df.index}
+        if kind.upper() == "HW":
+            col_keys = {c: _try(DateUtils.parse_period, c) for c in df.columns}
+        else:
+            # CIR cap/floor surface: columns are strikes ('ATM' is ignored)
+            col_keys = {
+                c: None if "ATM" in str(c).upper() else _try(_parse_strike, c)
+                for c in df.columns
+            }
+
+        data = [
+            (row_periods[r], col_keys[c], float(val))
+            for (r, c), val in cells.items()
+            if row_periods[r] is not None and col_keys[c] is not None
+        ]
         return data
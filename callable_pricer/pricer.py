@@ -1,6 +1,29 @@
+import functools
+import os
+from contextlib import contextmanager
+
+import numpy as np
 import QuantLib as ql
 
 from .engines import CIRPDEEngine, HullWhiteLSMCEngine, BKManualTreeEngine
+from .engines.base import curve_discounts, spread_prices
+
+# Opt-in: compile / load the engine kernels at import rather than on first use
+if os.environ.get("CALLABLE_PRICER_JIT") == "1":
+    from ._jit_warmup import warmup
+
+    warmup()
+
+# Manual engines: they expose price_multi, so base and bumped curves are priced
+# in one call sharing paths / grids / trees
+_MANUAL_ENGINES = {
+    "HW_LSMC": HullWhiteLSMCEngine,
+    "CIR_PDE": CIRPDEEngine,
+    "BK_MANUAL": BKManualTreeEngine,
+}
+
+# Bound on the memoized QuantLib tree engines (cleared when full)
+_MODEL_CACHE_SIZE = 64
 
 
 class MasterPricer:
@@ -34,83 +57,254 @@ class MasterPricer:
         self.ts_base = ts_base
         self.bond_spec = bond_spec
         self.cfg = cfg
-        self._keep_alive = []
+
+        # OAS and parallel-bump curves are built once on top of mutable quotes;
+        # repricing only updates the quote values (QuantLib observers propagate
+        # the change), instead of allocating new spreaded curves every call.
+        self._oas_quote = ql.SimpleQuote(0.0)
+        self._ts_oas = ql.ZeroSpreadedTermStructure(self.ts_base, ql.QuoteHandle(self._oas_quote))
+        self._ts_oas.enableExtrapolation()
+
+        self._shift_base = ql.RelinkableYieldTermStructureHandle()
+        self._up_quote = ql.SimpleQuote(0.0)
+        self._dn_quote = ql.SimpleQuote(0.0)
+        self._ts_up = ql.ZeroSpreadedTermStructure(self._shift_base, ql.QuoteHandle(self._up_quote))
+        self._ts_dn = ql.ZeroSpreadedTermStructure(self._shift_base, ql.QuoteHandle(self._dn_quote))
+        self._ts_up.enableExtrapolation()
+        self._ts_dn.enableExtrapolation()
+
+        # Scenario shift of the base curve (see ``bumped_curve``)
+        self._scenario_base = ql.RelinkableYieldTermStructureHandle()
+        self._scenario_quote = ql.SimpleQuote(0.0)
+        self._ts_scenario = ql.ZeroSpreadedTermStructure(self._scenario_base, ql.QuoteHandle(self._scenario_quote))
+        self._ts_scenario.enableExtrapolation()
+        self._scenario_active = False
+
+        # Bumped curves as seen by the engines, keyed on "OAS applied": the OAS
+        # spread sits on top of the bump, as when the base handle is relinked
+        ts_up_oas = ql.ZeroSpreadedTermStructure(ql.YieldTermStructureHandle(self._ts_up), ql.QuoteHandle(self._oas_quote))
+        ts_dn_oas = ql.ZeroSpreadedTermStructure(ql.YieldTermStructureHandle(self._ts_dn), ql.QuoteHandle(self._oas_quote))
+        ts_up_oas.enableExtrapolation()
+        ts_dn_oas.enableExtrapolation()
+        self._bumped_handles = {
+            False: (ql.YieldTermStructureHandle(self._ts_up), ql.YieldTermStructureHandle(self._ts_dn)),
+            True: (ql.YieldTermStructureHandle(ts_up_oas), ql.YieldTermStructureHandle(ts_dn_oas)),
+        }
+
+        # Handle on the OAS curve; the straight-bond engines on it and on the
+        # base handle (zero OAS) are built once
+        self._oas_handle = ql.YieldTermStructureHandle(self._ts_oas)
+        self._oas_straight_engine = ql.DiscountingBondEngine(self._oas_handle)
+        self._base_straight_engine = ql.DiscountingBondEngine(self.ts_base)
 
         # QuantLib reference instruments
         self.ql_straight = bond_spec.ql_straight_bond()
         self.ql_callable = bond_spec.ql_callable_bond()
 
+        # Method dispatch, built once: method key -> handler(params, ts_use, state_cache)
+        self._dispatch = {
+            "STRAIGHT BOND": self._price_straight,
+            "HW_QL_TREE": functools.partial(self._price_ql_tree, self._hw_model),
+            "CIR_QL_TREE": functools.partial(self._price_ql_tree, self._cir_model, pin_r0=True),
+            "BK_QL_TREE": functools.partial(self._price_ql_tree, self._bk_model),
+        }
+        for method, engine_cls in _MANUAL_ENGINES.items():
+            self._dispatch[method] = functools.partial(self._price_manual, engine_cls)
+        self._model_cache = {}
+
+        # Invariant inputs of the manual engines: the bond data dict and the
+        # accrued amount (which only moves with the evaluation date)
+        self._engine_data = bond_spec.to_engine_bond_data()
+        self._accrued_date = None
+        self._accrued = 0.0
+        self._straight_cf_key = None
+        self._straight_cf = None
+
+    def _accrued_amount(self):
+        """Accrued of the straight bond, recomputed only if the evaluation date moves."""
+        eval_date = ql.Settings.instance().evaluationDate
+        if eval_date != self._accrued_date:
+            self._accrued = float(self.ql_straight.accruedAmount())
+            self._accrued_date = eval_date
+        return self._accrued
+
     def _make_ts_with_oas(self, oas_decimal):
         """Return a YieldTermStructureHandle with OAS applied."""
         if abs(oas_decimal) <= 1e-12:
-            return ql.YieldTermStructureHandle(self.ts_base.currentLink())
-
-        risky_obj = ql.ZeroSpreadedTermStructure(
-            self.ts_base,
-            ql.QuoteHandle(ql.SimpleQuote(float(oas_decimal))),
-        )
-        risky_obj.enableExtrapolation()
+            # The relinkable base handle is itself a YieldTermStructureHandle
+            return self.ts_base
 
-        # Keep object alive to avoid Python/QL lifetime issues.
-        self._keep_alive = [risky_obj]
-        return ql.YieldTermStructureHandle(risky_obj)
+        self._oas_quote.setValue(float(oas_decimal))
+        return self._oas_handle
 
     def calculate(self, params, method, oas_decimal, state_cache=None):
         """Price (clean) a bond using a given method.
 
+        Unknown methods price to 0.0.
+
         Returns
         -------
         (clean_price, std_dev, state_cache)
         """
         ts_use = self._make_ts_with_oas(oas_decimal)
+        handler = self._dispatch.get(method)
+        if handler is None:
+            return 0.0, 0.0, None
+        return handler(params, ts_use, state_cache)
 
-        if method == "STRAIGHT BOND":
-            self.ql_straight.setPricingEngine(ql.DiscountingBondEngine(ts_use))
-            return float(self.ql_straight.cleanPrice()), 0.0, None
+    # ---------------------------------------------------------------------
+    # Per-method pricing (see ``_dispatch``)
+    # ---------------------------------------------------------------------
+    def _price_straight(self, params, ts_use, state_cache=None):
+        if ts_use is self._oas_handle:
+            engine = self._oas_straight_engine
+        else:
+            engine = self._base_straight_engine
+        self.ql_straight.setPricingEngine(engine)
+        return float(self.ql_straight.cleanPrice()), 0.0, None
 
-        accrued = float(self.ql_straight.accruedAmount())
+    def straight_bond_prices(self, spreads):
+        """Clean straight-bond prices for parallel zero spreads over the base curve.
 
-        if method == "HW_LSMC":
-            dirty, std, sc = HullWhiteLSMCEngine(self.cfg).price(
-                ts_use, self.bond_spec.to_engine_bond_data(), params, state_cache
+        Closed form of ``calculate(None, "STRAIGHT BOND", s)`` for every ``s``
+        in ``spreads`` (decimal): a continuous zero spread scales the discount
+        factors by exp(-s * t), so the remaining cashflows are discounted to
+        the settlement date in one (grid x cashflows) product.
+
+        Returns
+        -------
+        numpy.ndarray
+            One clean price per spread.
+        """
+        curve = self.ts_base.currentLink()
+        bond = self.ql_straight
+        settlement = bond.settlementDate()
+
+        # Remaining cashflow times / amounts only move with the settlement
+        # date and the curve's time axis (reference date, day count)
+        key = (settlement.serialNumber(), curve.referenceDate().serialNumber(), curve.dayCounter().name())
+        if key != self._straight_cf_key:
+            cfs = [cf for cf in bond.cashflows() if not cf.hasOccurred(settlement)]
+            self._straight_cf = (
+                np.array([curve.timeFromReference(cf.date()) for cf in cfs], dtype=np.float64),
+                np.array([cf.amount() for cf in cfs], dtype=np.float64),
+                curve.timeFromReference(settlement),
+                100.0 / bond.notional(settlement),
             )
-            return float(dirty - accrued), std, sc
+            self._straight_cf_key = key
+        cf_t, cf_amt, t_settle, scale = self._straight_cf
+
+        cf_pv = cf_amt * curve_discounts(curve, cf_t)
+        spreads = np.asarray(spreads, dtype=np.float64).reshape(-1)
+        values = spread_prices(cf_t, cf_pv, t_settle, curve.discount(t_settle), spreads)
+        return values * scale - self._accrued_amount()
+
+    def _price_manual(self, engine_cls, params, ts_use, state_cache=None):
+        dirty, std, sc = engine_cls(self.cfg).price_multi(
+            [ts_use], self._engine_data, params, state_cache
+        )
+        return float(dirty[0] - self._accrued_amount()), std[0], sc
 
-        if method == "CIR_PDE":
-            dirty, sc = CIRPDEEngine(self.cfg).price(
-                ts_use, self.bond_spec.to_engine_bond_data(), params, state_cache
+    def _price_ql_tree(self, build_model, params, ts_use, state_cache=None, pin_r0=False):
+        """QuantLib tree reference; failures price to 0.0.
+
+        Models and tree engines are memoized per (model, params, curve handle,
+        grid size). They observe the curve handle, so relinks and quote
+        changes propagate without a rebuild. ``pin_r0`` adds the curve r0 to
+        the key for models that freeze it at construction (extended CIR).
+        """
+        try:
+            key = (
+                build_model,
+                tuple(sorted(params.items())),
+                ts_use is self._oas_handle,
+                int(self.cfg.ql_grid_size),
             )
-            return float(dirty - accrued), 0.0, sc
+            if pin_r0:
+                key += (ts_use.currentLink().zeroRate(0.001, ql.Continuous).rate(),)
+
+            engine = self._model_cache.get(key)
+            if engine is None:
+                if len(self._model_cache) >= _MODEL_CACHE_SIZE:
+                    self._model_cache.clear()
+                model = build_model(ts_use, params)
+                engine = ql.TreeCallableFixedRateBondEngine(model, int(self.cfg.ql_grid_size))
+                self._model_cache[key] = engine
 
-        if method == "BK_MANUAL":
-            dirty, sc = BKManualTreeEngine(self.cfg).price(
-                ts_use, self.bond_spec.to_engine_bond_data(), params, state_cache
+            self.ql_callable.setPricingEngine(engine)
+            return float(self.ql_callable.cleanPrice()), 0.0, None
+        except Exception:
+            return 0.0, 0.0, None
+
+    @staticmethod
+    def _hw_model(ts_use, params):
+        return ql.HullWhite(ts_use, params["a"], params["sigma"])
+
+    @staticmethod
+    def _cir_model(ts_use, params):
+        r0 = ts_use.currentLink().zeroRate(0.001, ql.Continuous).rate()
+        return ql.ExtendedCoxIngersollRoss(
+            ts_use, params["theta"], params["k"], params["sigma"], r0
+        )
+
+    @staticmethod
+    def _bk_model(ts_use, params):
+        return ql.BlackKarasinski(ts_use, params["a"], params["sigma"])
+
+    @contextmanager
+    def bumped_curve(self, shift_bps):
+        """Temporarily shift the base curve in parallel by ``shift_bps``.
+
+        Within the block the base handle is linked to the current curve
+        spreaded by the shift (OAS and risk bumps apply on top); the original
+        link is restored on exit. The spreaded curve is built once and driven
+        by a quote, and cached models / tree engines observe the handle, so
+        nothing is rebuilt between shifts. Nested blocks get their own curve.
+        """
+        base_ptr = self.ts_base.currentLink()
+        shift = float(shift_bps) / 10000.0
+        if self._scenario_active:
+            ts_shift = ql.ZeroSpreadedTermStructure(
+                ql.YieldTermStructureHandle(base_ptr), ql.QuoteHandle(ql.SimpleQuote(shift))
             )
-            return float(dirty - accrued), 0.0, sc
+            ts_shift.enableExtrapolation()
+            nested = True
+        else:
+            self._scenario_base.linkTo(base_ptr)
+            self._scenario_quote.setValue(shift)
+            ts_shift = self._ts_scenario
+            nested = False
+            self._scenario_active = True
+        try:
+            self.ts_base.linkTo(ts_shift)
+            yield self.ts_base
+        finally:
+            self.ts_base.linkTo(base_ptr)
+            if not nested:
+                self._scenario_active = False
 
-        # QuantLib tree references
-        if "QL_TREE" in method:
-            try:
-                if method == "HW_QL_TREE":
-                    model = ql.HullWhite(ts_use, params["a"], params["sigma"])
-                elif method == "CIR_QL_TREE":
-                    r0 = ts_use.currentLink().zeroRate(0.001, ql.Continuous).rate()
-                    model = ql.ExtendedCoxIngersollRoss(
-                        ts_use, params["theta"], params["k"], params["sigma"], r0
-                    )
-                elif method == "BK_QL_TREE":
-                    model = ql.BlackKarasinski(ts_use, params["a"], params["sigma"])
-                else:
-                    return 0.0, 0.0, None
-
-                self.ql_callable.setPricingEngine(
-                    ql.TreeCallableFixedRateBondEngine(model, int(self.cfg.ql_grid_size))
-                )
-                return float(self.ql_callable.cleanPrice()), 0.0, None
-            except Exception:
-                return 0.0, 0.0, None
-
-        return 0.0, 0.0, None
+    def _set_bumps(self, base_ptr, dy):
+        """Point the bumped curves at ``base_ptr`` shifted by +dy / -dy."""
+        self._shift_base.linkTo(base_ptr)
+        self._up_quote.setValue(dy)
+        self._dn_quote.setValue(-dy)
+
+    def _price_with_bumps(self, engine_cls, params, oas_decimal, dy, state_cache=None):
+        """Clean prices on the base, up and down curves from one engine call.
+
+        Returns
+        -------
+        ([P0, Pup, Pdn], base-run std error, state_cache)
+        """
+        ts_use = self._make_ts_with_oas(oas_decimal)
+        self._set_bumps(self.ts_base.currentLink(), dy)
+        ts_up, ts_dn = self._bumped_handles[ts_use is self._oas_handle]
+
+        dirty, std, sc = engine_cls(self.cfg).price_multi(
+            [ts_use, ts_up, ts_dn], self._engine_data, params, state_cache
+        )
+        accrued = self._accrued_amount()
+        return [float(d - accrued) for d in dirty], float(std[0]), sc
 
     def metrics(self, params, method, oas_decimal, state_cache=None, return_state=False):
         """Return (price, effective duration, effective convexity).
@@ -129,38 +323,44 @@ class MasterPricer:
         return_state : bool
             If True, also returns the base-run cache.
         """
-        P0, std0, state = self.calculate(params, method, oas_decimal, state_cache)
+        # Parallel bump size used for risk metrics (default 1bp, see AppConfig).
+        dy = float(getattr(self.cfg, "risk_bump_bps", self.cfg.bump_bps)) / 10000.0
+
+        engine_cls = _MANUAL_ENGINES.get(method)
+        batched = engine_cls is not None and abs(dy) >= 1e-12
+        closed_form = method == "STRAIGHT BOND" and abs(dy) >= 1e-12
+        if closed_form:
+            # Base and bumped curves are the base curve plus a total zero spread
+            P0, Pup, Pdn = self.straight_bond_prices((oas_decimal, oas_decimal + dy, oas_decimal - dy)).tolist()
+            std0, state = 0.0, None
+        elif batched:
+            (P0, Pup, Pdn), std0, state = self._price_with_bumps(engine_cls, params, oas_decimal, dy, state_cache)
+        else:
+            P0, std0, state = self.calculate(params, method, oas_decimal, state_cache)
+
         if P0 <= 1e-8:
             if return_state:
                 return 0.0, 0.0, 0.0, 0.0, state
             return 0.0, 0.0, 0.0, 0.0
 
-        # Parallel bump size used for risk metrics (default 1bp, see AppConfig).
-        dy = float(getattr(self.cfg, "risk_bump_bps", self.cfg.bump_bps)) / 10000.0
         if abs(dy) < 1e-12:
             if return_state:
                 return float(P0), 0.0, 0.0, float(std0), state
             return float(P0), 0.0, 0.0, float(std0)
 
-        base_ptr = self.ts_base.currentLink()
-        try:
-            ts_up = ql.ZeroSpreadedTermStructure(
-                ql.YieldTermStructureHandle(base_ptr),
-                ql.QuoteHandle(ql.SimpleQuote(dy)),
-            )
-            ts_up.enableExtrapolation()
-            self.ts_base.linkTo(ts_up)
-            Pup, _, _ = self.calculate(params, method, oas_decimal, state)
+        if not (batched or closed_form):
+            # The bumped curves spread the current base curve by the bump
+            # quotes; the base handle is relinked to them for the reprices.
+            base_ptr = self.ts_base.currentLink()
+            self._set_bumps(base_ptr, dy)
+            try:
+                self.ts_base.linkTo(self._ts_up)
+                Pup, _, _ = self.calculate(params, method, oas_decimal, state)
 
-            ts_dn = ql.ZeroSpreadedTermStructure(
-                ql.YieldTermStructureHandle(base_ptr),
-                ql.QuoteHandle(ql.SimpleQuote(-dy)),
-            )
-            ts_dn.enableExtrapolation()
-            self.ts_base.linkTo(ts_dn)
-            Pdn, _, _ = self.calculate(params, method, oas_decimal, state)
-        finally:
-            self.ts_base.linkTo(base_ptr)
+                self.ts_base.linkTo(self._ts_dn)
+                Pdn, _, _ = self.calculate(params, method, oas_decimal, state)
+            finally:
+                self.ts_base.linkTo(base_ptr)
 
         dur = (Pdn - Pup) / (2.0 * P0 * dy)
         conv = (Pup + Pdn - 2.0 * P0) / (P0 * (dy ** 2))
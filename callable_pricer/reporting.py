@@ -1,8 +1,56 @@
+import functools
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
+from .io_fast import read_csv_fast
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+def _dumps(obj):
+    """Indented, key-sorted JSON bytes (orjson when installed, else stdlib)."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=float,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+    return json.dumps(obj, indent=2, sort_keys=True, default=float).encode("utf-8")
+
+
+# Raster resolution of every saved figure
+_FIG_DPI = 150
+
+
+@functools.lru_cache(maxsize=None)
+def _figure_factory():
+    """Return a callable creating an Agg-backed ``Figure``, or None.
+
+    Figures are built with the object-oriented API and their own Agg canvas,
+    so nothing is registered in pyplot's global figure manager (no
+    ``plt.close`` bookkeeping, no interactive backend). Returns None when
+    matplotlib is not installed. The import is attempted once per process.
+    """
+    try:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+    except Exception:
+        return None
+
+    def new_figure():
+        fig = Figure()
+        FigureCanvasAgg(fig)
+        return fig
+
+    return new_figure
+
 
 def ensure_dir(path):
     p = Path(path)
@@ -10,20 +58,36 @@ def ensure_dir(path):
     return p
 
 
-def save_results_table(results_df, output_dir):
-    """Save the main results table (price, duration, convexity) as CSV."""
+def _write_table(df, path, report_format="csv"):
+    """Write ``df`` to ``path`` as CSV, or as Parquet next to it.
+
+    CSV floats are written with ``%.8g`` (no repr round-trip formatting);
+    'parquet' writes ``path`` with a .parquet suffix (pyarrow, snappy) and
+    falls back to CSV when pyarrow is not installed. Returns the path
+    actually written.
+    """
+    path = Path(path)
+    if str(report_format).lower() == "parquet":
+        try:
+            df.to_parquet(path.with_suffix(".parquet"), engine="pyarrow", compression="snappy", index=False)
+            return path.with_suffix(".parquet")
+        except ImportError:
+            pass
+    df.to_csv(path, index=False, float_format="%.8g")
+    return path
+
+
+def save_results_table(results_df, output_dir, report_format="csv"):
+    """Save the main results table (price, duration, convexity) as CSV or Parquet."""
     out = ensure_dir(output_dir)
-    csv_path = out / "results_summary.csv"
-    results_df.to_csv(csv_path, index=False)
-    return csv_path
+    return _write_table(results_df, out / "results_summary.csv", report_format)
 
 
 def save_calibration_params(calib_params, output_dir):
     """Save calibrated parameters as JSON for auditability."""
     out = ensure_dir(output_dir)
     path = out / "calibration_params.json"
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(calib_params, f, indent=2, sort_keys=True, default=float)
+    path.write_bytes(_dumps(calib_params))
     return path
 
 
@@ -38,8 +102,7 @@ def save_config_snapshot(cfg, output_dir):
             d[k] = str(v)
         elif isinstance(v, (int, float, str, bool)):
             d[k] = v
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(d, f, indent=2, sort_keys=True)
+    path.write_bytes(_dumps(d))
     return path
 
 
@@ -53,24 +116,22 @@ def maybe_plot_results(results_df, output_dir):
 
     If matplotlib is not available, this function does nothing.
     """
-    try:
-        import matplotlib.pyplot as plt
-    except Exception:
+    new_figure = _figure_factory()
+    if new_figure is None:
         return []
 
     out = ensure_dir(Path(output_dir) / "figures")
     paths = []
 
     def _bar(metric, filename, ylabel):
-        fig = plt.figure()
+        fig = new_figure()
         ax = fig.add_subplot(111)
         ax.bar(results_df["method"], results_df[metric])
         ax.set_ylabel(ylabel)
         ax.set_xticklabels(results_df["method"], rotation=45, ha="right")
         fig.tight_layout()
         p = out / filename
-        fig.savefig(p, dpi=200)
-        plt.close(fig)
+        fig.savefig(p, dpi=_FIG_DPI)
         paths.append(p)
 
     _bar("price", "price_bar.png", "Clean price")
@@ -80,21 +141,21 @@ def maybe_plot_results(results_df, output_dir):
     return paths
 
 
-def maybe_plot_curve_from_csv(curve_csv_path, output_dir):
+def maybe_plot_curve_from_csv(curve_csv_path, output_dir, fast_io=False):
     """Plot the input curve if the CSV is available.
 
     Expected columns (flexible): a date column and either discount factor or rate.
+    With ``fast_io`` the CSV is read through PyArrow when installed.
     """
-    try:
-        import matplotlib.pyplot as plt
-    except Exception:
+    new_figure = _figure_factory()
+    if new_figure is None:
         return None
 
     curve_csv_path = Path(curve_csv_path)
     if not curve_csv_path.exists():
         return None
 
-    df = pd.read_csv(curve_csv_path)
+    df = read_csv_fast(curve_csv_path, use_arrow=fast_io)
     # heuristic column discovery
     col_date = next((c for c in df.columns if "data" in c.lower() or "vertice" in c.lower() or "date" in c.lower()), None)
     col_df = next((c for c in df.columns if "fator" in c.lower() or "desconto" in c.lower() or "df" == c.lower()), None)
@@ -106,7 +167,7 @@ def maybe_plot_curve_from_csv(curve_csv_path, output_dir):
     df[col_date] = pd.to_datetime(df[col_date])
     df = df.sort_values(col_date)
 
-    fig = plt.figure()
+    fig = new_figure()
     ax = fig.add_subplot(111)
     if col_df is not None:
         ax.plot(df[col_date], df[col_df])
@@ -123,30 +184,31 @@ def maybe_plot_curve_from_csv(curve_csv_path, output_dir):
 
     out = ensure_dir(Path(output_dir) / "figures")
     p = out / "curve.png"
-    fig.savefig(p, dpi=200)
-    plt.close(fig)
+    fig.savefig(p, dpi=_FIG_DPI)
     return p
 
 
-def maybe_plot_surface_from_csv(surface_csv_path, output_dir, title="surface"):
-    """Plot a generic volatility surface CSV as a heatmap."""
-    try:
-        import matplotlib.pyplot as plt
-    except Exception:
+def maybe_plot_surface_from_csv(surface_csv_path, output_dir, title="surface", fast_io=False):
+    """Plot a generic volatility surface CSV as a heatmap.
+
+    With ``fast_io`` the CSV is read through PyArrow when installed.
+    """
+    new_figure = _figure_factory()
+    if new_figure is None:
         return None
 
     surface_csv_path = Path(surface_csv_path)
     if not surface_csv_path.exists():
         return None
 
-    df = pd.read_csv(surface_csv_path)
+    df = read_csv_fast(surface_csv_path, use_arrow=fast_io)
     if df.empty or len(df.columns) < 2:
         return None
 
     df = df.set_index(df.columns[0])
     values = df.values.astype(float)
 
-    fig = plt.figure()
+    fig = new_figure()
     ax = fig.add_subplot(111)
     im = ax.imshow(values, aspect="auto")
     ax.set_title(title)
@@ -159,12 +221,11 @@ def maybe_plot_surface_from_csv(surface_csv_path, output_dir, title="surface"):
 
     out = ensure_dir(Path(output_dir) / "figures")
     p = out / f"{title.replace(' ', '_').lower()}.png"
-    fig.savefig(p, dpi=200)
-    plt.close(fig)
+    fig.savefig(p, dpi=_FIG_DPI)
     return p
 
 
-def save_hw_exercise_probabilities(state_cache, output_dir):
+def save_hw_exercise_probabilities(state_cache, output_dir, report_format="csv"):
     """If available, save LSMC exercise probabilities by call date."""
     if not state_cache:
         return None
@@ -173,30 +234,29 @@ def save_hw_exercise_probabilities(state_cache, output_dir):
     # (A) Monolithic prototype: {"exercise_prob": {"YYYY-MM-DD": prob, ...}}
     # (B) Experimental format: {"exercise_probs_by_step": {step: prob}, "call_step_to_date": {step: "YYYY-MM-DD"}}
     if "exercise_prob" in state_cache and isinstance(state_cache.get("exercise_prob"), dict):
-        rows = [{"call_date": str(d), "exercise_prob": float(p)} for d, p in state_cache["exercise_prob"].items()]
+        probs = state_cache["exercise_prob"]
+        call_dates = [str(d) for d in probs]
     else:
         probs = state_cache.get("exercise_probs_by_step")
         step_to_date = state_cache.get("call_step_to_date")
         if not probs or not step_to_date:
             return None
+        call_dates = [step_to_date.get(step) for step in probs]
 
-        rows = []
-        for step, p in probs.items():
-            rows.append({"call_date": step_to_date.get(step), "exercise_prob": float(p)})
-
-    df = pd.DataFrame(rows).sort_values("call_date")
+    df = pd.DataFrame({
+        "call_date": call_dates,
+        "exercise_prob": np.fromiter(probs.values(), dtype=np.float64, count=len(probs)),
+    }).sort_values("call_date")
 
     out = ensure_dir(output_dir)
-    path = out / "hw_lsmc_exercise_probabilities.csv"
-    df.to_csv(path, index=False)
+    path = _write_table(df, out / "hw_lsmc_exercise_probabilities.csv", report_format)
 
     # optional plot
-    try:
-        import matplotlib.pyplot as plt
-    except Exception:
+    new_figure = _figure_factory()
+    if new_figure is None:
         return path
 
-    fig = plt.figure()
+    fig = new_figure()
     ax = fig.add_subplot(111)
     ax.bar(df["call_date"], df["exercise_prob"])
     ax.set_ylabel("Exercise probability (risk-neutral)")
@@ -206,18 +266,30 @@ def save_hw_exercise_probabilities(state_cache, output_dir):
 
     fig_dir = ensure_dir(Path(output_dir) / "figures")
     fig_path = fig_dir / "hw_lsmc_exercise_probabilities.png"
-    fig.savefig(fig_path, dpi=200)
-    plt.close(fig)
+    fig.savefig(fig_path, dpi=_FIG_DPI)
 
     return path
 
 
-def save_dataframe(df, output_dir, filename):
-    """Save a DataFrame to CSV inside ``output_dir``."""
+def save_dataframe(df, output_dir, filename, report_format="csv"):
+    """Save a DataFrame to CSV (or Parquet) inside ``output_dir``."""
     out = ensure_dir(output_dir)
-    p = out / filename
-    df.to_csv(p, index=False)
-    return p
+    return _write_table(df, out / filename, report_format)
+
+
+def save_dataframes(frames, output_dir, report_format="csv", max_workers=4):
+    """Save several DataFrames inside ``output_dir`` concurrently.
+
+    ``frames`` maps file name -> DataFrame (see :func:`save_dataframe`). The
+    writes run on a thread pool: pandas releases the GIL while formatting /
+    encoding and during file I/O. Returns the written paths, in input order.
+    """
+    out = ensure_dir(output_dir)
+    items = list(frames.items())
+    if len(items) <= 1 or max_workers <= 1:
+        return [_write_table(df, out / name, report_format) for name, df in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as ex:
+        return list(ex.map(lambda item: _write_table(item[1], out / item[0], report_format), items))
 
 
 def maybe_plot_sensitivity(df, output_dir, x_col, title, xlabel, ylabel, filename_png):
@@ -236,12 +308,11 @@ def maybe_plot_sensitivity(df, output_dir, x_col, title, xlabel, ylabel, filenam
     filename_png : str
         Output filename (e.g. 'price_vs_oas.png').
     """
-    try:
-        import matplotlib.pyplot as plt
-    except Exception:
+    new_figure = _figure_factory()
+    if new_figure is None:
         return None
 
-    fig = plt.figure()
+    fig = new_figure()
     ax = fig.add_subplot(111)
 
     x = df[x_col].values
@@ -259,6 +330,5 @@ def maybe_plot_sensitivity(df, output_dir, x_col, title, xlabel, ylabel, filenam
 
     fig_dir = ensure_dir(Path(output_dir) / "figures")
     p = fig_dir / filename_png
-    fig.savefig(p, dpi=200)
-    plt.close(fig)
+    fig.savefig(p, dpi=_FIG_DPI)
     return p
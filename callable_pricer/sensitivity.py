@@ -12,23 +12,153 @@ The three standard sweeps implemented here are:
 
 The functions return ``pandas.DataFrame`` objects in a *wide* format: the first
 column is the x-axis, and each additional column is a method label.
+
+Each x-axis point is independent, so with ``cfg.n_workers != 1`` (or an
+explicit ``workers`` argument) the points are priced in forked worker
+processes; :func:`price_all_sweeps` pools the points of all three sweeps.
+Every worker prices on its own copy of the pricer, so curve relinking in one
+point never leaks into another; rows keep the input order.
+
+The straight bond is priced in closed form over the whole rate-shift / OAS
+grid (see ``MasterPricer.straight_bond_prices``) instead of point by point.
 """
 
+import numpy as np
 import pandas as pd
-import QuantLib as ql
 
+from .utils import fork_pool
+
+_STRAIGHT = "STRAIGHT BOND"
+
+# Pricer and row builders shared with the sweep workers. QuantLib objects
+# cannot be pickled, so workers are forked after this is set and only
+# (sweep name, x) pairs travel through the pool.
+_SWEEP_CONTEXT = {}
+
+
+def _sweep_worker(task):
+    name, x = task
+    return _SWEEP_CONTEXT['rows'][name](_SWEEP_CONTEXT['pricer'], x)
+
+
+def _run_sweeps(pricer, sweeps, workers=None):
+    """Price every point of several sweeps through one worker pool.
+
+    ``sweeps`` maps a sweep name to ``(xs, row)``; the result maps the same
+    name to ``[row(pricer, x) for x in xs]``. All points are pooled together,
+    so short sweeps do not leave workers idle while a long one finishes.
+    """
+    tasks = [(name, x) for name, (xs, _) in sweeps.items() for x in xs]
+    rows_by_name = {name: row for name, (_, row) in sweeps.items()}
+    if workers is None:
+        workers = int(getattr(pricer.cfg, 'n_workers', 1))
+
+    pool = None
+    if workers != 1 and len(tasks) > 1:
+        _SWEEP_CONTEXT.update(pricer=pricer, rows=rows_by_name)
+        pool = fork_pool(workers)
+    try:
+        if pool is None:
+            results = [rows_by_name[name](pricer, x) for name, x in tasks]
+        else:
+            try:
+                results = pool.map(_sweep_worker, tasks, chunksize=1)
+            finally:
+                pool.close()
+                pool.join()
+    finally:
+        _SWEEP_CONTEXT.clear()
+
+    out, i = {}, 0
+    for name, (xs, _) in sweeps.items():
+        out[name] = results[i:i + len(xs)]
+        i += len(xs)
+    return out
+
+
+def _run_sweep(pricer, xs, row, workers=None):
+    """Return ``[row(pricer, x) for x in xs]``, in parallel when requested."""
+    return _run_sweeps(pricer, {None: (list(xs), row)}, workers)[None]
+
+
+def _sweep_frame(x_col, xs, scenarios, rows):
+    """Wide DataFrame from the x values and the per-point price rows.
+
+    Columns are built as whole float64 arrays (one per method label) rather
+    than inferred row by row.
+    """
+    prices = np.asarray(rows, dtype=np.float64).reshape(len(xs), len(scenarios))
+    cols = {x_col: np.asarray(xs, dtype=np.float64)}
+    for j, (label, _, _) in enumerate(scenarios):
+        cols[label] = prices[:, j]
+    return pd.DataFrame(cols)
+
+
+def _split_straight(scenarios):
+    """(mask of STRAIGHT BOND scenarios, the other scenarios)."""
+    straight = np.array([method == _STRAIGHT for _, _, method in scenarios], dtype=bool)
+    return straight, [sc for sc, is_straight in zip(scenarios, straight) if not is_straight]
 
-def _scale_sigma(params, multiplier):
-    """Return a copy of params with sigma scaled, if sigma exists."""
-    if params is None:
-        return None
-    p = dict(params)
-    if "sigma" in p and p["sigma"] is not None:
-        p["sigma"] = float(params["sigma"]) * float(multiplier)
-    return p
 
+def _with_straight(pricer, straight, rows, spreads):
+    """Price matrix from engine ``rows`` plus closed-form straight-bond columns.
 
-def price_vs_volatility(pricer, scenarios, oas_decimal, vol_multipliers):
+    ``rows`` hold the non-straight scenarios only; the straight-bond price at
+    each point is ``pricer.straight_bond_prices`` at the total zero spread.
+    """
+    prices = np.empty((len(spreads), straight.size), dtype=np.float64)
+    n_others = int((~straight).sum())
+    prices[:, ~straight] = np.asarray(rows, dtype=np.float64).reshape(len(spreads), n_others)
+    if straight.any():
+        prices[:, straight] = pricer.straight_bond_prices(spreads)[:, None]
+    return prices
+
+
+def _volatility_row(scenarios, oas_decimal):
+    def row_for(pricer, m):
+        row = []
+        for _, params, method in scenarios:
+            # Scale sigma in place and restore it afterwards (no dict copy)
+            sigma = params.get("sigma") if params is not None else None
+            if sigma is None:
+                price, _, _ = pricer.calculate(params, method, oas_decimal, state_cache=None)
+            else:
+                params["sigma"] = float(sigma) * float(m)
+                try:
+                    price, _, _ = pricer.calculate(params, method, oas_decimal, state_cache=None)
+                finally:
+                    params["sigma"] = sigma
+            row.append(float(price))
+        return row
+
+    return row_for
+
+
+def _rate_shift_row(scenarios, oas_decimal):
+    def row_for(pricer, bps):
+        with pricer.bumped_curve(bps):
+            row = []
+            for _, params, method in scenarios:
+                price, _, _ = pricer.calculate(params, method, oas_decimal, state_cache=None)
+                row.append(float(price))
+            return row
+
+    return row_for
+
+
+def _oas_row(scenarios):
+    def row_for(pricer, bps):
+        oas_decimal = float(bps) / 10000.0
+        row = []
+        for _, params, method in scenarios:
+            price, _, _ = pricer.calculate(params, method, oas_decimal, state_cache=None)
+            row.append(float(price))
+        return row
+
+    return row_for
+
+
+def price_vs_volatility(pricer, scenarios, oas_decimal, vol_multipliers, workers=None):
     """Compute callable bond price sensitivity to the vol parameter.
 
     Parameters
@@ -40,56 +170,71 @@ def price_vs_volatility(pricer, scenarios, oas_decimal, vol_multipliers):
         Credit spread (OAS) in decimal terms (e.g. 90bps -> 0.0090).
     vol_multipliers : iterable[float]
         Multiplicative bumps applied to the model sigma parameter.
+    workers : int or None
+        Worker processes (None: ``cfg.n_workers``; 1: serial).
     """
-    rows = []
-    for m in vol_multipliers:
-        row = {"vol_multiplier": float(m)}
-        for label, params, method in scenarios:
-            p = _scale_sigma(params, m)
-            price, _, _ = pricer.calculate(p, method, oas_decimal, state_cache=None)
-            row[label] = float(price)
-        rows.append(row)
-    return pd.DataFrame(rows)
-
-
-def price_vs_rate_shift(pricer, scenarios, oas_decimal, rate_shifts_bps):
+    vol_multipliers = list(vol_multipliers)
+    rows = _run_sweep(pricer, vol_multipliers, _volatility_row(scenarios, oas_decimal), workers)
+    return _sweep_frame("vol_multiplier", vol_multipliers, scenarios, rows)
+
+
+def price_vs_rate_shift(pricer, scenarios, oas_decimal, rate_shifts_bps, workers=None):
     """Compute price sensitivity to a parallel shift of the risk-free curve.
 
     The shift is applied to the *risk-free* curve used as the base term
     structure. The OAS is then applied on top of the shifted curve.
     """
-    base_ptr = pricer.ts_base.currentLink()
-    rows = []
-    try:
-        for bps in rate_shifts_bps:
-            shift = float(bps) / 10000.0
-            # Build a shifted curve on top of the current base_ptr
-            ts_shift = ql.ZeroSpreadedTermStructure(
-                ql.YieldTermStructureHandle(base_ptr),
-                ql.QuoteHandle(ql.SimpleQuote(shift)),
-            )
-            ts_shift.enableExtrapolation()
-            pricer.ts_base.linkTo(ts_shift)
-
-            row = {"rate_shift_bps": float(bps)}
-            for label, params, method in scenarios:
-                price, _, _ = pricer.calculate(params, method, oas_decimal, state_cache=None)
-                row[label] = float(price)
-            rows.append(row)
-    finally:
-        pricer.ts_base.linkTo(base_ptr)
-
-    return pd.DataFrame(rows)
+    rate_shifts_bps = list(rate_shifts_bps)
+    straight, others = _split_straight(scenarios)
+    rows = _run_sweep(pricer, rate_shifts_bps, _rate_shift_row(others, oas_decimal), workers)
+    spreads = np.asarray(rate_shifts_bps, dtype=np.float64) / 10000.0 + oas_decimal
+    prices = _with_straight(pricer, straight, rows, spreads)
+    return _sweep_frame("rate_shift_bps", rate_shifts_bps, scenarios, prices)
 
 
-def price_vs_oas(pricer, scenarios, oas_grid_bps):
+def price_vs_oas(pricer, scenarios, oas_grid_bps, workers=None):
     """Compute price sensitivity to the credit spread (OAS)."""
-    rows = []
-    for bps in oas_grid_bps:
-        oas_decimal = float(bps) / 10000.0
-        row = {"oas_bps": float(bps)}
-        for label, params, method in scenarios:
-            price, _, _ = pricer.calculate(params, method, oas_decimal, state_cache=None)
-            row[label] = float(price)
-        rows.append(row)
-    return pd.DataFrame(rows)
+    oas_grid_bps = list(oas_grid_bps)
+    straight, others = _split_straight(scenarios)
+    rows = _run_sweep(pricer, oas_grid_bps, _oas_row(others), workers)
+    spreads = np.asarray(oas_grid_bps, dtype=np.float64) / 10000.0
+    prices = _with_straight(pricer, straight, rows, spreads)
+    return _sweep_frame("oas_bps", oas_grid_bps, scenarios, prices)
+
+
+def price_all_sweeps(
+    pricer, scenarios, oas_decimal, vol_multipliers, rate_shifts_bps, oas_grid_bps, workers=None
+):
+    """Run the three standard sweeps together.
+
+    Equivalent to calling :func:`price_vs_volatility`,
+    :func:`price_vs_rate_shift` and :func:`price_vs_oas` in turn, but every
+    (sweep, x) point goes through a single worker pool.
+
+    Returns
+    -------
+    tuple[pandas.DataFrame, pandas.DataFrame, pandas.DataFrame]
+        (price vs volatility, price vs rate shift, price vs OAS).
+    """
+    vol_multipliers = list(vol_multipliers)
+    rate_shifts_bps = list(rate_shifts_bps)
+    oas_grid_bps = list(oas_grid_bps)
+    straight, others = _split_straight(scenarios)
+    rows = _run_sweeps(
+        pricer,
+        {
+            "vol": (vol_multipliers, _volatility_row(scenarios, oas_decimal)),
+            "rate": (rate_shifts_bps, _rate_shift_row(others, oas_decimal)),
+            "oas": (oas_grid_bps, _oas_row(others)),
+        },
+        workers,
+    )
+    rate_spreads = np.asarray(rate_shifts_bps, dtype=np.float64) / 10000.0 + oas_decimal
+    oas_spreads = np.asarray(oas_grid_bps, dtype=np.float64) / 10000.0
+    rate_prices = _with_straight(pricer, straight, rows["rate"], rate_spreads)
+    oas_prices = _with_straight(pricer, straight, rows["oas"], oas_spreads)
+    return (
+        _sweep_frame("vol_multiplier", vol_multipliers, scenarios, rows["vol"]),
+        _sweep_frame("rate_shift_bps", rate_shifts_bps, scenarios, rate_prices),
+        _sweep_frame("oas_bps", oas_grid_bps, scenarios, oas_prices),
+    )
@@ -1,14 +1,16 @@
+import functools
+import gc
+import logging
+import multiprocessing
+import re
+
 import QuantLib as ql
 import pandas as pd
 
+_log = logging.getLogger(__name__)
 
-def us_calendar():
-    """Return a *generic* United States calendar with robust fallbacks.
-
-    We intentionally keep this as "generic" (Settlement/GovernmentBond/no-arg)
-    because different QuantLib builds expose different market enums.
-    """
 
+def _resolve_us_calendar():
     # Prefer the Settlement calendar when available (broadest in practice)
     try:
         if hasattr(ql.UnitedStates, "Settlement"):
@@ -33,25 +35,17 @@ def us_calendar():
     return ql.TARGET()
 
 
-def us_sofr_calendar():
-    """Return the United States SOFR calendar if available (fallback to US).
-
-    Some QuantLib versions expose `UnitedStates.SOFR`. When absent, we fallback
-    to a generic US calendar.
-    """
-
+def _resolve_us_sofr_calendar():
     try:
         if hasattr(ql.UnitedStates, "SOFR"):
             return ql.UnitedStates(getattr(ql.UnitedStates, "SOFR"))
     except Exception:
         pass
 
-    return us_calendar()
+    return _US_CALENDAR
 
 
-def thirty360_usa():
-    """Return a 30/360 day count with robust fallbacks."""
-
+def _resolve_thirty360_usa():
     try:
         return ql.Thirty360(ql.Thirty360.USA)
     except Exception:
@@ -65,6 +59,111 @@ def thirty360_usa():
     return ql.Actual360()
 
 
+# The QuantLib build is fixed for the life of the process, so the fallback
+# chains run once at import. Calendars and day counters are immutable and
+# safe to share.
+_US_CALENDAR = _resolve_us_calendar()
+_US_SOFR_CALENDAR = _resolve_us_sofr_calendar()
+_THIRTY360_USA = _resolve_thirty360_usa()
+
+
+def us_calendar():
+    """Return a *generic* United States calendar with robust fallbacks.
+
+    We intentionally keep this as "generic" (Settlement/GovernmentBond/no-arg)
+    because different QuantLib builds expose different market enums.
+    """
+    return _US_CALENDAR
+
+
+def us_sofr_calendar():
+    """Return the United States SOFR calendar if available (fallback to US).
+
+    Some QuantLib versions expose `UnitedStates.SOFR`. When absent, we fallback
+    to a generic US calendar.
+    """
+    return _US_SOFR_CALENDAR
+
+
+def thirty360_usa():
+    """Return a 30/360 day count with robust fallbacks."""
+    return _THIRTY360_USA
+
+
+def fork_pool(workers):
+    """Process pool sharing the parent's QuantLib objects, or None if serial.
+
+    Requires the 'fork' start method (unavailable on Windows) and no Numba
+    parallel threads already running in this process; otherwise the caller
+    runs serially (with a logged warning when Numba threads are the reason).
+    ``workers`` < 0 uses every CPU.
+
+    Workers see the parent's curve, vol data and pricer through the
+    copy-on-write pages of the fork (nothing is reloaded or pickled). The
+    parent's objects are moved to the GC's permanent generation while the
+    workers are forked, so collections in a worker do not write to (and
+    copy) those shared pages.
+    """
+    from .engines._jit import parallel_threads_started
+
+    if workers == 1:
+        return None
+    if parallel_threads_started():
+        _log.warning(
+            "fork_pool(%s): Numba parallel threads are already running in this "
+            "process, so the work runs serially instead of in forked workers", workers
+        )
+        return None
+    try:
+        ctx = multiprocessing.get_context('fork')
+    except ValueError:
+        return None
+    gc.freeze()
+    try:
+        return ctx.Pool(None if workers < 0 else int(workers))
+    finally:
+        gc.unfreeze()
+
+
+# Tenor labels such as '1Mo', '10Yr', '6M', '2 Years', '1W'
+_PERIOD_RE = re.compile(r"^(\d+)\s*(MONTHS?|MO|M|YEARS?|YR|Y|WEEKS?|WK|W|DAYS?|D)$")
+_PERIOD_UNITS = {
+    "M": ql.Months, "MO": ql.Months, "MONTH": ql.Months, "MONTHS": ql.Months,
+    "Y": ql.Years, "YR": ql.Years, "YEAR": ql.Years, "YEARS": ql.Years,
+    "W": ql.Weeks, "WK": ql.Weeks, "WEEK": ql.Weeks, "WEEKS": ql.Weeks,
+    "D": ql.Days, "DAY": ql.Days, "DAYS": ql.Days,
+}
+
+
+# Period units -> (units per year, payments per year for a non-positive length)
+_UNITS_PER_YEAR = {
+    ql.Years: (1.0, 1.0),
+    ql.Months: (12.0, 2.0),
+    ql.Weeks: (52.0, 52.0),
+    ql.Days: (365.0, 365.0),
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_period(n, units):
+    """Shared ql.Period(n, units); aliases such as '6M' / '6Mo' reuse one object."""
+    return ql.Period(n, units)
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_frequency_period(freq):
+    return ql.Period(freq)
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_period_cached(s):
+    m = _PERIOD_RE.match(s)
+    if m is not None:
+        return _cached_period(int(m.group(1)), _PERIOD_UNITS[m.group(2)])
+    # Fallback to QuantLib's parser (e.g. '1Y6M')
+    return ql.Period(s)
+
+
 class DateUtils:
     """Small helpers to keep date/period parsing in one place."""
 
@@ -77,35 +176,50 @@ class DateUtils:
             d = pd.to_datetime(d).date()
         return ql.Date(d.day, d.month, d.year)
 
+    @staticmethod
+    def to_ql_dates(values):
+        """Vectorized ``to_ql_date`` for a Series / array / list of dates.
+
+        Strings are parsed in a single ``pd.to_datetime`` call and the
+        QuantLib dates are built from the day/month/year components.
+        """
+        dt = pd.to_datetime(pd.Series(values))
+        Date = ql.Date
+        return [
+            Date(d, m, y)
+            for d, m, y in zip(dt.dt.day.tolist(), dt.dt.month.tolist(), dt.dt.year.tolist())
+        ]
+
     @staticmethod
     def parse_period(s):
-        """Parse strings such as '1Mo', '3Mo', '1Yr', '10Yr', '6M', '1Y'."""
-        s = str(s).strip().upper()
-        # Normalize common suffixes
-        s = s.replace("MONTH", "M").replace("MO", "M")
-        s = s.replace("YEAR", "Y").replace("YR", "Y")
-        if s.endswith("M"):
-            n = int(s[:-1])
-            return ql.Period(n, ql.Months)
-        if s.endswith("Y"):
-            n = int(s[:-1])
-            return ql.Period(n, ql.Years)
-        # Fallback to QuantLib's parser (e.g. '6M')
-        return ql.Period(s)
+        """Parse strings such as '1Mo', '3Mo', '1Yr', '10Yr', '6M', '1Y'.
+
+        Results are memoized per label (surface headers repeat across loads).
+        """
+        return _parse_period_cached(str(s).strip().upper())
 
     @staticmethod
     def ensure_period(freq_or_period):
         """Convert Frequency/Period/string to QuantLib.Period."""
-        if isinstance(freq_or_period, ql.Period):
-            return freq_or_period
         if isinstance(freq_or_period, str):
             return DateUtils.parse_period(freq_or_period)
+        if isinstance(freq_or_period, ql.Period):
+            return freq_or_period
         # QuantLib Frequency is an int enum (e.g. ql.Semiannual)
         try:
-            return ql.Period(freq_or_period)
+            return _cached_frequency_period(freq_or_period)
         except Exception:
             # fallback: assume annual
-            return ql.Period(1, ql.Years)
+            return _cached_period(1, ql.Years)
+
+    @staticmethod
+    def ensure_period_fast(p):
+        """``ensure_period`` for internal callers that usually hold a ql.Period.
+
+        An exact ql.Period is returned as is, skipping the str / isinstance
+        dispatch; anything else goes through ``ensure_period``.
+        """
+        return p if type(p) is ql.Period else DateUtils.ensure_period(p)
 
     @staticmethod
     def payments_per_year(freq_or_period):
@@ -113,16 +227,11 @@ class DateUtils:
 
         This is used only to translate coupon_rate (annual) to coupon amount per period.
         """
-        p = DateUtils.ensure_period(freq_or_period)
+        p = DateUtils.ensure_period_fast(freq_or_period)
+        entry = _UNITS_PER_YEAR.get(p.units())
+        if entry is None:
+            # fallback
+            return 2.0
+        per_year, default = entry
         n = p.length()
-        units = p.units()
-        if units == ql.Years:
-            return 1.0 / float(n) if n > 0 else 1.0
-        if units == ql.Months:
-            return 12.0 / float(n) if n > 0 else 2.0
-        if units == ql.Weeks:
-            return 52.0 / float(n) if n > 0 else 52.0
-        if units == ql.Days:
-            return 365.0 / float(n) if n > 0 else 365.0
-        # fallback
-        return 2.0
+        return per_year / float(n) if n > 0 else default
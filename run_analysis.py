@@ -4,7 +4,7 @@ from pathlib import Path
 import QuantLib as ql
 import pandas as pd
 
-from callable_pricer.calibration import Calibrator
+from callable_pricer.calibration import Calibrator, cached_calibration, calibration_cache_key
 from callable_pricer.config import AppConfig
 from callable_pricer.instruments import CallableBondSpec
 from callable_pricer.market import MarketLoader
@@ -15,12 +15,61 @@ from callable_pricer.reporting import (
     maybe_plot_surface_from_csv,
     save_calibration_params,
     save_config_snapshot,
-    save_dataframe,
+    save_dataframes,
     save_hw_exercise_probabilities,
     maybe_plot_sensitivity,
     save_results_table,
 )
-from callable_pricer.sensitivity import price_vs_oas, price_vs_rate_shift, price_vs_volatility
+from callable_pricer.sensitivity import price_all_sweeps
+from callable_pricer.utils import fork_pool
+
+
+# Columns of the results table (one row tuple per scenario)
+_RESULT_COLUMNS = ["method", "price", "duration", "convexity", "std_error"]
+
+# HW_LSMC state_cache entries used by save_hw_exercise_probabilities
+_REPORTED_STATE_KEYS = ("exercise_prob", "exercise_probs_by_step", "call_step_to_date")
+
+# Pricer and scenarios shared with the forked scenario workers (QuantLib
+# objects cannot be pickled; only scenario indices travel through the pool).
+_SCENARIO_CONTEXT = {}
+
+
+def _price_scenario(i):
+    """metrics() for scenario ``i``: ((price, dur, conv, se, state), None) or (None, error)."""
+    pricer = _SCENARIO_CONTEXT["pricer"]
+    _, params, method = _SCENARIO_CONTEXT["scenarios"][i]
+    try:
+        if method == "HW_LSMC":
+            *metrics, state = pricer.metrics(params, method, _SCENARIO_CONTEXT["oas"], return_state=True)
+            # Send back only what the exercise report reads (not the CRN draws
+            # or the ql.Date cashflow cache)
+            state = {k: state[k] for k in _REPORTED_STATE_KEYS if k in state}
+            return (*metrics, state), None
+        return (*pricer.metrics(params, method, _SCENARIO_CONTEXT["oas"]), None), None
+    except Exception as e:
+        return None, str(e)
+
+
+def _price_scenarios(pricer, scenarios, oas_decimal, workers):
+    """Price every scenario, in scenario order.
+
+    The scenarios are independent; with ``workers`` != 1 they are priced in
+    forked worker processes (the exercise-probability part of the HW_LSMC
+    state cache is pickled back for the report).
+    """
+    _SCENARIO_CONTEXT.update(pricer=pricer, scenarios=scenarios, oas=oas_decimal)
+    try:
+        pool = fork_pool(workers) if len(scenarios) > 1 else None
+        if pool is None:
+            return [_price_scenario(i) for i in range(len(scenarios))]
+        try:
+            return pool.map(_price_scenario, range(len(scenarios)), chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+    finally:
+        _SCENARIO_CONTEXT.clear()
 
 
 def main():
@@ -29,6 +78,7 @@ def main():
     # -------------------------------------------------------------------------
     val_date = ql.Date(10, 9, 2025)
     oas_bps = 73.0
+    oas_decimal = oas_bps / 10000.0
 
     cfg = AppConfig(val_date, oas_bps)
     cfg.apply_global_settings()
@@ -70,14 +120,28 @@ def main():
     # -------------------------------------------------------------------------
     print("--- 2. Calibrando ---")
     calib = Calibrator(ts_relinkable)
-
-    p_hw = calib.calibrate_hw(hw_vols)
+    cir_method = "least_squares"
+
+    # Parameters are reused from the cache while the inputs are unchanged
+    if cfg.calibration_cache:
+        cache_dir = out_dir / "cache"
+        key = calibration_cache_key(
+            (curve_csv, hw_vol_csv, cir_vol_csv), val_date, settings={"cir_method": cir_method}
+        )
+
+        def calibrate(name, fn, *args):
+            return cached_calibration(cache_dir, key, name, lambda: fn(*args))
+    else:
+        def calibrate(name, fn, *args):
+            return fn(*args)
+
+    p_hw = calibrate("hw", calib.calibrate_hw, hw_vols)
     print(f"HW: a={p_hw['a']:.4f}, sigma={p_hw['sigma']:.4f}")
 
-    p_cir = calib.calibrate_cir(cir_vols)
+    p_cir = calibrate("cir", calib.calibrate_cir, cir_vols, cir_method)
     print(f"CIR: theta={p_cir['theta']:.4f}, k={p_cir['k']:.4f}, sigma={p_cir['sigma']:.4f}")
 
-    p_bk = calib.calibrate_bk(hw_vols)
+    p_bk = calibrate("bk", calib.calibrate_bk, hw_vols)
     print(f"BK: a={p_bk['a']:.4f}, sigma={p_bk['sigma']:.4f}")
 
     calib_params = {"HW": p_hw, "CIR": p_cir, "BK": p_bk}
@@ -106,48 +170,61 @@ def main():
     print("-" * 78)
 
     results = []
+    nan = float("nan")
     hw_state_cache = None
 
-    for label, params, method in scenarios:
-        try:
+    outcomes = _price_scenarios(pricer, scenarios, oas_decimal, cfg.n_workers)
+    for (label, params, method), (res, err) in zip(scenarios, outcomes):
+        if err is None:
+            price, dur, conv, se, state = res
             if method == "HW_LSMC":
-                price, dur, conv, se, state = pricer.metrics(params, method, oas_bps / 10000.0, return_state=True)
                 hw_state_cache = state
-            else:
-                price, dur, conv, se = pricer.metrics(params, method, oas_bps / 10000.0)
 
             print(f"{label:<25} | {price:<10.4f} | {dur:<10.4f} | {conv:<10.4f} | {se:<10.4f}")
-            results.append({"method": label, "price": price, "duration": dur, "convexity": conv, "std_error": se})
+            results.append((label, price, dur, conv, se))
 
-        except Exception as e:
-            print(f"{label:<25} | ERRO: {str(e)}")
-            results.append({"method": label, "price": float("nan"), "duration": float("nan"), "convexity": float("nan"), "std_error": float("nan")})
+        else:
+            print(f"{label:<25} | ERRO: {err}")
+            results.append((label, nan, nan, nan, nan))
 
-    results_df = pd.DataFrame(results)
+    results_df = pd.DataFrame.from_records(results, columns=_RESULT_COLUMNS)
 
     # -------------------------------------------------------------------------
     # 4. Outputs (CSV + figures)
     # -------------------------------------------------------------------------
-    save_results_table(results_df, out_dir)
+    save_results_table(results_df, out_dir, report_format=cfg.report_format)
     save_calibration_params(calib_params, out_dir)
     save_config_snapshot(cfg, out_dir)
 
     maybe_plot_results(results_df, out_dir)
-    maybe_plot_curve_from_csv(curve_csv, out_dir)
-    maybe_plot_surface_from_csv(hw_vol_csv, out_dir, title="swaption_normal_vol_surface")
-    maybe_plot_surface_from_csv(cir_vol_csv, out_dir, title="capfloor_vol_surface")
+    maybe_plot_curve_from_csv(curve_csv, out_dir, fast_io=cfg.fast_io)
+    maybe_plot_surface_from_csv(hw_vol_csv, out_dir, title="swaption_normal_vol_surface", fast_io=cfg.fast_io)
+    maybe_plot_surface_from_csv(cir_vol_csv, out_dir, title="capfloor_vol_surface", fast_io=cfg.fast_io)
 
-    save_hw_exercise_probabilities(hw_state_cache, out_dir)
+    save_hw_exercise_probabilities(hw_state_cache, out_dir, report_format=cfg.report_format)
 
     # ---------------------------------------------------------------------
     # 5. Sensitivity figures (Chapter 4)
     # ---------------------------------------------------------------------
-    oas_decimal = oas_bps / 10000.0
+    vol_multipliers = [0.5, 0.75, 1.0, 1.25, 1.5, 2.0]
+    rate_shifts_bps = [-200, -100, -50, 0, 50, 100, 200]
+    oas_grid_bps = [0, 25, 50, 75, 90, 100, 150, 200]
+
+    # All three sweeps share one worker pool (cfg.n_workers)
+    df_vol, df_rate, df_oas = price_all_sweeps(
+        pricer, scenarios, oas_decimal, vol_multipliers, rate_shifts_bps, oas_grid_bps
+    )
+    save_dataframes(
+        {
+            "sensitivity_price_vs_volatility.csv": df_vol,
+            "sensitivity_price_vs_rate_shift.csv": df_rate,
+            "sensitivity_price_vs_oas.csv": df_oas,
+        },
+        out_dir,
+        report_format=cfg.report_format,
+    )
 
     # 5.1 Price vs volatility (scale model sigma)
-    vol_multipliers = [0.5, 0.75, 1.0, 1.25, 1.5, 2.0]
-    df_vol = price_vs_volatility(pricer, scenarios, oas_decimal, vol_multipliers)
-    save_dataframe(df_vol, out_dir, "sensitivity_price_vs_volatility.csv")
     maybe_plot_sensitivity(
         df_vol,
         out_dir,
@@ -159,9 +236,6 @@ def main():
     )
 
     # 5.2 Price vs interest rates (parallel shift)
-    rate_shifts_bps = [-200, -100, -50, 0, 50, 100, 200]
-    df_rate = price_vs_rate_shift(pricer, scenarios, oas_decimal, rate_shifts_bps)
-    save_dataframe(df_rate, out_dir, "sensitivity_price_vs_rate_shift.csv")
     maybe_plot_sensitivity(
         df_rate,
         out_dir,
@@ -173,9 +247,6 @@ def main():
     )
 
     # 5.3 Price vs credit spread (OAS)
-    oas_grid_bps = [0, 25, 50, 75, 90, 100, 150, 200]
-    df_oas = price_vs_oas(pricer, scenarios, oas_grid_bps)
-    save_dataframe(df_oas, out_dir, "sensitivity_price_vs_oas.csv")
     maybe_plot_sensitivity(
         df_oas,
         out_dir,
@@ -0,0 +1,45 @@
+import os
+import sys
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+import QuantLib as ql
+
+# Allow running tests without installing the package.
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from callable_pricer import AppConfig, CallableBondSpec, MasterPricer
+
+
+@pytest.fixture(scope="module")
+def flat_ctx():
+    """Flat 4% curve, a two-call bond and a pricer on coarse grids, built once per module.
+
+    Unit tests use this instead of the market data of the smoke test; the
+    curve handle is the pricer's ``ts_base``, so tests that relink it must
+    restore it.
+    """
+    val_date = ql.Date(10, 9, 2025)
+    cfg = AppConfig(val_date, oas_bps=73.0, bump_bps=1.0)
+    cfg.mc_paths = 2000
+    cfg.pde_grid_size = 200
+    cfg.pde_steps_year = 25
+    cfg.bk_steps_year = 12
+    ql.Settings.instance().evaluationDate = val_date
+
+    bond = CallableBondSpec(
+        face=100.0,
+        coupon_rate=0.035,
+        coupon_frequency=ql.Semiannual,
+        issue_date=date(2015, 12, 2),
+        maturity_date=date(2035, 12, 2),
+        call_schedule=[(date(2030, 12, 2), 100.0), (date(2034, 8, 12), 100.0)],
+    )
+
+    flat = ql.FlatForward(val_date, 0.04, ql.Actual360())
+    flat.enableExtrapolation()
+    curve = ql.RelinkableYieldTermStructureHandle(flat)
+    return SimpleNamespace(cfg=cfg, bond=bond, curve=curve, pricer=MasterPricer(curve, bond, cfg))
@@ -0,0 +1,49 @@
+import os
+import sys
+
+import QuantLib as ql
+
+# Allow running tests without installing the package.
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from callable_pricer.calibration import cached_calibration, calibration_cache_key
+
+
+def test_cached_calibration_hit_and_miss(tmp_path):
+    calls = []
+
+    def calibrate():
+        calls.append(1)
+        return {"a": 0.01, "sigma": 0.0081}
+
+    first = cached_calibration(tmp_path, "k1", "hw", calibrate)
+    second = cached_calibration(tmp_path, "k1", "hw", calibrate)
+    assert first == second == {"a": 0.01, "sigma": 0.0081}
+    assert len(calls) == 1
+
+    cached_calibration(tmp_path, "k2", "hw", calibrate)
+    cached_calibration(tmp_path, "k1", "bk", calibrate)
+    assert len(calls) == 3
+
+    # An unreadable entry is recomputed and rewritten
+    (tmp_path / "k1_hw.json").write_text("not json")
+    assert cached_calibration(tmp_path, "k1", "hw", calibrate) == first
+    assert len(calls) == 4
+    assert cached_calibration(tmp_path, "k1", "hw", calibrate) == first
+    assert len(calls) == 4
+
+
+def test_calibration_cache_key_covers_inputs_and_settings(tmp_path):
+    path = tmp_path / "curve.csv"
+    path.write_text("date,rate\n2025-09-10,0.04\n")
+    d = ql.Date(10, 9, 2025)
+
+    key = calibration_cache_key([path], d, settings={"cir_method": "least_squares"})
+    assert key == calibration_cache_key([path], d, settings={"cir_method": "least_squares"})
+    assert key != calibration_cache_key([path], d, settings={"cir_method": "de"})
+    assert key != calibration_cache_key([path], d + 1, settings={"cir_method": "least_squares"})
+
+    path.write_text("date,rate\n2025-09-10,0.041\n")
+    assert key != calibration_cache_key([path], d, settings={"cir_method": "least_squares"})
@@ -0,0 +1,255 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+import QuantLib as ql
+from scipy.linalg import solve_banded
+
+# Allow running tests without installing the package.
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from callable_pricer.engines import BKManualTreeEngine, CIRPDEEngine, HullWhiteLSMCEngine
+from callable_pricer.engines import base, bk_tree, cir_pde, hw_lsmc
+from callable_pricer.engines._jit import HAS_NUMBA
+
+requires_numba = pytest.mark.skipif(not HAS_NUMBA, reason="kernels are the numpy fallbacks without Numba")
+
+
+def _spreaded(handle, dy):
+    """Handle on ``handle``'s curve shifted by a parallel zero spread ``dy``."""
+    ts = ql.ZeroSpreadedTermStructure(handle, ql.QuoteHandle(ql.SimpleQuote(dy)))
+    ts.enableExtrapolation()
+    return ql.YieldTermStructureHandle(ts)
+
+
+def _tridiagonal_system(n, seed=0):
+    """Diagonally dominant (A, B, C) with A[0] = C[-1] = 0, and a right-hand side."""
+    rng = np.random.default_rng(seed)
+    A = rng.uniform(-0.5, 0.0, n)
+    C = rng.uniform(-0.5, 0.0, n)
+    A[0] = 0.0
+    C[-1] = 0.0
+    B = 1.5 + rng.uniform(0.0, 1.0, n)
+    return A, B, C, rng.normal(size=n)
+
+
+# -----------------------------------------------------------------------------
+# CIR PDE: tridiagonal kernels
+# -----------------------------------------------------------------------------
+def test_thomas_solve_matches_solve_banded():
+    A, B, C, d = _tridiagonal_system(200)
+    cprime, inv_denom = cir_pde._thomas_factor(A, B, C)
+    out = np.empty_like(d)
+    cir_pde._thomas_solve(A, cprime, inv_denom, d, out)
+
+    ab = np.zeros((3, d.size))
+    ab[0, 1:] = C[:-1]
+    ab[1] = B
+    ab[2, :-1] = A[1:]
+    np.testing.assert_allclose(out, solve_banded((1, 1), ab, d), rtol=1e-12, atol=1e-12)
+
+
+def test_tridiag_matvec_matches_dense():
+    R_sub, R_main, R_sup, V = _tridiagonal_system(50, seed=1)
+    M = np.diag(R_main) + np.diag(R_sub[1:], -1) + np.diag(R_sup[:-1], 1)
+    out = np.empty_like(V)
+    cir_pde._tridiag_matvec(R_sub, R_main, R_sup, V, out)
+    np.testing.assert_allclose(out, M @ V, rtol=1e-12, atol=1e-12)
+
+
+@requires_numba
+def test_cir_stepper_lapack_fallback_matches_thomas(monkeypatch):
+    A, B, C, V = _tridiagonal_system(100, seed=2)
+    R_sub, R_main, R_sup = -A, 2.0 - B, -C
+
+    jit_step = cir_pde._build_stepper(A, B, C, R_sub, R_main, R_sup)
+    monkeypatch.setattr(cir_pde, "HAS_NUMBA", False)
+    lapack_step = cir_pde._build_stepper(A, B, C, R_sub, R_main, R_sup)
+
+    np.testing.assert_allclose(
+        lapack_step(V, np.empty_like(V)), jit_step(V, np.empty_like(V)), rtol=1e-12, atol=1e-12
+    )
+
+
+# -----------------------------------------------------------------------------
+# CIR PDE: operator cache in state_cache
+# -----------------------------------------------------------------------------
+@pytest.mark.parametrize("shift_theta", [True, False])
+def test_cir_operator_cache_matches_fresh_build(flat_ctx, monkeypatch, shift_theta):
+    monkeypatch.setattr(flat_ctx.cfg, "pde_shift_theta_with_curve", shift_theta)
+    engine = CIRPDEEngine(flat_ctx.cfg)
+    bond_data = flat_ctx.bond.to_engine_bond_data()
+    params = {"theta": 0.04, "k": 0.3, "sigma": 0.05}
+    bumped = _spreaded(flat_ctx.curve, 0.001)
+
+    _, state = engine.price(flat_ctx.curve, bond_data, params)
+    grid, stepper = state["pde_grid"], state["pde_stepper"]
+    value, state = engine.price(bumped, bond_data, params, state)
+
+    # The diffusion part is always shared; the factorized stepper only when
+    # theta does not move with the curve
+    assert state["pde_grid"] is grid
+    assert (state["pde_stepper"] is stepper) is not shift_theta
+    assert value == engine.price(bumped, bond_data, params, {"r0_base": state["r0_base"]})[0]
+
+    # A new sigma invalidates both parts
+    params["sigma"] = 0.06
+    value, state = engine.price(bumped, bond_data, params, state)
+    assert state["pde_grid"] is not grid
+    assert value == engine.price(bumped, bond_data, params, {"r0_base": state["r0_base"]})[0]
+
+
+# -----------------------------------------------------------------------------
+# HW LSMC: OU state and path kernels
+# -----------------------------------------------------------------------------
+@pytest.mark.parametrize("a, dt, N", [
+    (0.05, 1.0 / 24.0, 240),   # closed-form cumsum branch
+    (0.0, 1.0 / 24.0, 240),    # a ~ 0: Brownian state
+    (30.0, 1.0 / 24.0, 240),   # strong mean reversion: explicit recursion branch
+])
+def test_simulate_state_matches_ou_recursion(a, dt, N):
+    sigma = 0.01
+    Z = np.random.default_rng(3).standard_normal((N, 500)).astype(np.float32)
+    X = HullWhiteLSMCEngine._simulate_state(Z, a, sigma, dt)
+
+    decay = 1.0 if abs(a) < 1e-12 else 1.0 - a * dt
+    ref = np.zeros((N + 1, Z.shape[1]))
+    for i in range(N):
+        ref[i + 1] = decay * ref[i] + sigma * np.sqrt(dt) * Z[i]
+
+    assert X.shape == (N + 1, Z.shape[1])
+    assert X.dtype == np.float32
+    np.testing.assert_allclose(X, ref, rtol=0.0, atol=1e-5 * sigma * np.sqrt(N * dt))
+
+
+@requires_numba
+def test_hw_backward_step_numpy_fallbacks_match_kernels():
+    rng = np.random.default_rng(4)
+    X = rng.normal(0.0, 0.01, 1000).astype(np.float32)
+    V0 = rng.uniform(90.0, 110.0, 1000)
+
+    V_jit, V_np = V0.copy(), V0.copy()
+    hw_lsmc._discount_step(V_jit, X, 0.03, 0.04, 1.75)
+    hw_lsmc._discount_step_numpy(V_np, X, 0.03, 0.04, 1.75)
+    np.testing.assert_allclose(V_jit, V_np, rtol=1e-12)
+
+    betas = np.array([99.0, -120.0, 90.0])
+    V_jit, V_np = V0.copy(), V0.copy()
+    n_jit = hw_lsmc._exercise_step(V_jit, X, betas, 100.0, 0.0)
+    n_np = hw_lsmc._exercise_step_numpy(V_np, X, betas, 100.0, 0.0)
+    assert n_jit == n_np
+    np.testing.assert_array_equal(V_jit, V_np)
+
+
+@requires_numba
+def test_hw_regression_moments_match_numpy_fallback():
+    rng = np.random.default_rng(5)
+    X = rng.normal(0.0, 0.01, 1000).astype(np.float32)
+    V = rng.uniform(90.0, 110.0, 1000)
+
+    S_jit, b_jit = hw_lsmc._regression_moments(X, V)
+    S_np, b_np = hw_lsmc._regression_moments_numpy(X, V)
+    np.testing.assert_allclose(S_jit, S_np, rtol=1e-9)
+    np.testing.assert_allclose(b_jit, b_np, rtol=1e-9)
+
+
+# -----------------------------------------------------------------------------
+# BK tree kernels
+# -----------------------------------------------------------------------------
+@requires_numba
+def test_bk_backward_step_numpy_fallback_matches_kernel():
+    rng = np.random.default_rng(6)
+    j_max = 6
+    n = 2 * j_max + 1
+    V = rng.uniform(90.0, 110.0, n)
+    k = rng.integers(-1, 2, n).astype(np.int64)
+    pu = rng.uniform(0.1, 0.3, n)
+    pd = rng.uniform(0.1, 0.3, n)
+    pm = 1.0 - pu - pd
+    disc = rng.uniform(0.99, 1.0, n)
+    for has_call in (False, True):
+        V_jit, V_np = np.empty(n), np.empty(n)
+        args = (V, k, pu, pm, pd, disc, j_max)
+        bk_tree._backward_step(*args, V_jit, np.float64(1.75), np.float64(100.0), np.bool_(has_call))
+        bk_tree._backward_step_numpy(*args, V_np, 1.75, 100.0, has_call)
+        np.testing.assert_allclose(V_jit, V_np, rtol=1e-14)
+
+
+@requires_numba
+def test_bk_forward_weights_numpy_fallback_matches_kernel():
+    rng = np.random.default_rng(7)
+    j_max = 6
+    js = np.arange(-j_max, j_max + 1)
+    Q = rng.uniform(0.0, 0.2, js.size)
+
+    w_jit, w_np = np.empty(js.size), np.empty(js.size)
+    bk_tree._compute_w(Q, np.log(0.04), js, 0.1, 1.0 / 52.0, w_jit)
+    bk_tree._compute_w_numpy(Q, np.log(0.04), js, 0.1, 1.0 / 52.0, w_np)
+    np.testing.assert_allclose(w_jit, w_np, rtol=1e-14)
+
+
+# -----------------------------------------------------------------------------
+# Straight-bond closed form
+# -----------------------------------------------------------------------------
+def test_spread_prices_matches_discounting_bond_engine():
+    today = ql.Date(10, 9, 2025)
+    ql.Settings.instance().evaluationDate = today
+    curve = ql.FlatForward(today, 0.04, ql.Actual365Fixed())
+    schedule = ql.Schedule(
+        ql.Date(2, 12, 2015), ql.Date(2, 12, 2035), ql.Period(ql.Semiannual), ql.NullCalendar(),
+        ql.Unadjusted, ql.Unadjusted, ql.DateGeneration.Backward, False,
+    )
+    bond = ql.FixedRateBond(0, 100.0, schedule, [0.035], ql.Thirty360(ql.Thirty360.USA))
+    settlement = bond.settlementDate()
+
+    cfs = [cf for cf in bond.cashflows() if not cf.hasOccurred(settlement)]
+    cf_t = np.array([curve.timeFromReference(cf.date()) for cf in cfs])
+    cf_pv = np.array([cf.amount() * curve.discount(cf.date()) for cf in cfs])
+    t_settle = curve.timeFromReference(settlement)
+
+    spreads = np.array([-0.005, 0.0, 0.0073, 0.02])
+    values = base.spread_prices(cf_t, cf_pv, t_settle, curve.discount(settlement), spreads)
+    for s, value in zip(spreads, values):
+        bond.setPricingEngine(ql.DiscountingBondEngine(_spreaded(ql.YieldTermStructureHandle(curve), s)))
+        assert value == pytest.approx(bond.dirtyPrice(), abs=1e-10)
+
+
+@requires_numba
+def test_spread_prices_numpy_fallback_matches_kernel():
+    rng = np.random.default_rng(8)
+    cf_t = np.sort(rng.uniform(0.1, 10.0, 20))
+    cf_pv = rng.uniform(1.0, 2.0, 20)
+    spreads = np.array([-0.01, 0.0, 0.0073, 0.02])
+    np.testing.assert_allclose(
+        base.spread_prices(cf_t, cf_pv, 0.01, 0.9999, spreads),
+        base._spread_prices_numpy(cf_t, cf_pv, 0.01, 0.9999, spreads),
+        rtol=1e-13,
+    )
+
+
+# -----------------------------------------------------------------------------
+# price_multi == sequential price calls sharing state_cache
+# -----------------------------------------------------------------------------
+@pytest.mark.parametrize("engine_cls, params", [
+    (HullWhiteLSMCEngine, {"a": 0.03, "sigma": 0.01}),
+    (CIRPDEEngine, {"theta": 0.04, "k": 0.3, "sigma": 0.05}),
+    (BKManualTreeEngine, {"a": 0.1, "sigma": 0.2}),
+])
+def test_price_multi_matches_sequential_price(flat_ctx, engine_cls, params):
+    engine = engine_cls(flat_ctx.cfg)
+    bond_data = flat_ctx.bond.to_engine_bond_data()
+    handles = [flat_ctx.curve, _spreaded(flat_ctx.curve, 0.001), _spreaded(flat_ctx.curve, -0.001)]
+
+    dirty, std, _ = engine.price_multi(handles, bond_data, dict(params))
+
+    state = None
+    for ts, expected in zip(handles, dirty):
+        res = engine.price(ts, bond_data, dict(params), state)
+        state = res[-1]
+        assert res[0] == pytest.approx(expected, rel=1e-12)
+
+    assert len(std) == len(handles)
+    assert dirty[2] > dirty[0] > dirty[1]
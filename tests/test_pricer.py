@@ -0,0 +1,64 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Allow running tests without installing the package.
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+
+# -----------------------------------------------------------------------------
+# Closed-form straight bond
+# -----------------------------------------------------------------------------
+def test_straight_bond_prices_match_quantlib(flat_ctx):
+    pricer = flat_ctx.pricer
+    spreads = np.array([0.0, 0.0025, 0.0073, -0.01])
+    expected = [pricer.calculate(None, "STRAIGHT BOND", s)[0] for s in spreads]
+    np.testing.assert_allclose(pricer.straight_bond_prices(spreads), expected, rtol=0.0, atol=1e-10)
+
+
+def test_straight_bond_metrics_match_bump_and_reprice(flat_ctx):
+    pricer = flat_ctx.pricer
+    oas = 0.0073
+    dy = pricer.cfg.risk_bump_bps / 10000.0
+    P0, dur, conv, se = pricer.metrics(None, "STRAIGHT BOND", oas)
+
+    P0_ql = pricer.calculate(None, "STRAIGHT BOND", oas)[0]
+    Pup = pricer.calculate(None, "STRAIGHT BOND", oas + dy)[0]
+    Pdn = pricer.calculate(None, "STRAIGHT BOND", oas - dy)[0]
+    assert P0 == pytest.approx(P0_ql, abs=1e-10)
+    assert dur == pytest.approx((Pdn - Pup) / (2.0 * P0_ql * dy), rel=1e-7)
+    assert conv == pytest.approx((Pup + Pdn - 2.0 * P0_ql) / (P0_ql * dy ** 2), rel=1e-5)
+    assert se == 0.0
+
+
+# -----------------------------------------------------------------------------
+# bumped_curve
+# -----------------------------------------------------------------------------
+def test_bumped_curve_shifts_and_restores(flat_ctx):
+    pricer = flat_ctx.pricer
+    d0 = pricer.ts_base.discount(5.0)
+    with pricer.bumped_curve(100):
+        assert pricer.ts_base.discount(5.0) == pytest.approx(d0 * np.exp(-0.01 * 5.0), rel=1e-12)
+        with pricer.bumped_curve(-100):
+            assert pricer.ts_base.discount(5.0) == pytest.approx(d0, rel=1e-12)
+    assert pricer.ts_base.discount(5.0) == d0
+
+
+def test_bumped_curve_restores_link_on_exception(flat_ctx):
+    pricer = flat_ctx.pricer
+    d0 = pricer.ts_base.discount(5.0)
+    with pytest.raises(ZeroDivisionError):
+        with pricer.bumped_curve(50):
+            assert pricer.ts_base.discount(5.0) != d0
+            1 / 0
+    assert pricer.ts_base.discount(5.0) == d0
+    assert not pricer._scenario_active
+
+    # The shared scenario curve is free again (not treated as nested)
+    with pricer.bumped_curve(25):
+        assert pricer.ts_base.discount(5.0) == pytest.approx(d0 * np.exp(-0.0025 * 5.0), rel=1e-12)
+    assert pricer.ts_base.discount(5.0) == d0
@@ -2,6 +2,7 @@ import os
 import sys
 from datetime import date
 
+import pytest
 import QuantLib as ql
 
 # Allow running tests without installing the package.
@@ -12,15 +13,16 @@ if BASE_DIR not in sys.path:
 from callable_pricer import AppConfig, MarketLoader, Calibrator, CallableBondSpec, MasterPricer
 
 
-def test_smoke_run():
-    """Basic smoke test: load data, calibrate, price.
+@pytest.fixture(scope="module")
+def pricer_ctx():
+    """Load data, calibrate and build the pricer once for the module.
 
-    This is not a unit test of financial correctness; it checks that the code
-    runs end-to-end without exploding.
+    Set PRICER_TEST_FAST=1 to shrink the numerical grids (see AppConfig).
     """
     val_date = ql.Date(10, 9, 2025)
     cfg = AppConfig(val_date, oas_bps=73.0, bump_bps=1.0)
-    cfg.mc_paths = 2000  # speed-up for CI/smoke
+    if os.environ.get("PRICER_TEST_FAST") != "1":
+        cfg.mc_paths = 2000  # speed-up for CI/smoke
     cfg.apply_global_settings()
 
     bond = CallableBondSpec(
@@ -32,8 +34,7 @@ def test_smoke_run():
         call_schedule=[(date(2034, 8, 12), 100.0)],
     )
 
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    data_dir = os.path.join(base_dir, 'data')
+    data_dir = os.path.join(BASE_DIR, 'data')
 
     loader = MarketLoader(cfg)
     ts = loader.load_curve(os.path.join(data_dir, 'sofr_curve.csv'))
@@ -42,21 +43,33 @@ def test_smoke_run():
     cir_vols = loader.load_vols(os.path.join(data_dir, 'sup_vol_capfloor_CIR.csv'), kind='CIR')
 
     calib = Calibrator(ts)
-    p_hw = calib.calibrate_hw(hw_vols)
-    p_cir = calib.calibrate_cir(cir_vols)
-    p_bk = calib.calibrate_bk(hw_vols)
+    params = {
+        'hw': calib.calibrate_hw(hw_vols),
+        'cir': calib.calibrate_cir(cir_vols),
+        'bk': calib.calibrate_bk(hw_vols),
+    }
 
     pricer = MasterPricer(ts, bond, cfg)
-    oas = cfg.oas_bps / 10000.0
+    return pricer, params
+
+
+@pytest.mark.parametrize('method,params_key', [
+    ('STRAIGHT BOND', None),
+    ('HW_LSMC', 'hw'),
+    ('CIR_PDE', 'cir'),
+    ('BK_MANUAL', 'bk'),
+])
+def test_smoke_run(pricer_ctx, method, params_key):
+    """Basic smoke test: load data, calibrate, price.
+
+    This is not a unit test of financial correctness; it checks that the code
+    runs end-to-end without exploding.
+    """
+    pricer, params = pricer_ctx
+    oas = pricer.cfg.oas_bps / 10000.0
 
     # Prices should be finite
-    for method, params in [
-        ('STRAIGHT BOND', None),
-        ('HW_LSMC', p_hw),
-        ('CIR_PDE', p_cir),
-        ('BK_MANUAL', p_bk),
-    ]:
-        p, d, c = pricer.metrics(params, method, oas)
-        assert abs(p) < 1e6
-        assert abs(d) < 1e6
-        assert abs(c) < 1e6
+    p, d, c, _ = pricer.metrics(params.get(params_key), method, oas)
+    assert abs(p) < 1e6
+    assert abs(d) < 1e6
+    assert abs(c) < 1e6
@@ -0,0 +1,102 @@
+import logging
+import os
+import subprocess
+import sys
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+import QuantLib as ql
+
+# Allow running tests without installing the package.
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from callable_pricer.engines import hw_lsmc
+from callable_pricer.engines._jit import HAS_NUMBA
+from callable_pricer.utils import DateUtils, fork_pool
+
+
+@pytest.mark.parametrize("label, n, units", [
+    ("1Mo", 1, ql.Months),
+    ("10Yr", 10, ql.Years),
+    ("6M", 6, ql.Months),
+    (" 3mo ", 3, ql.Months),
+    ("2 Years", 2, ql.Years),
+    ("1 month", 1, ql.Months),
+    ("1W", 1, ql.Weeks),
+    ("2wk", 2, ql.Weeks),
+    ("30D", 30, ql.Days),
+    ("1Y6M", 18, ql.Months),  # QuantLib parser fallback
+])
+def test_parse_period(label, n, units):
+    p = DateUtils.parse_period(label)
+    assert (p.length(), p.units()) == (n, units)
+
+
+def test_parse_period_aliases_share_one_period():
+    assert DateUtils.parse_period("6M") is DateUtils.parse_period("6Mo")
+    assert DateUtils.parse_period("6M") is DateUtils.parse_period(" 6 months")
+
+
+def test_parse_period_rejects_unknown_units():
+    with pytest.raises(RuntimeError):
+        DateUtils.parse_period("abc")
+
+
+def test_to_ql_dates_mixed_inputs():
+    values = ["2024-02-29", date(2025, 12, 31), pd.Timestamp("2030-01-01")]
+    assert DateUtils.to_ql_dates(values) == [
+        ql.Date(29, 2, 2024), ql.Date(31, 12, 2025), ql.Date(1, 1, 2030)
+    ]
+
+
+def test_to_ql_dates_matches_scalar_conversion():
+    values = pd.Series(["2025-09-10", "2026-03-10", "2035-12-02"])
+    assert DateUtils.to_ql_dates(values) == [DateUtils.to_ql_date(v) for v in values]
+    dt64 = np.array(["2024-01-05"], dtype="datetime64[ns]")
+    assert DateUtils.to_ql_dates(dt64) == [ql.Date(5, 1, 2024)]
+
+
+def test_to_ql_dates_empty():
+    assert DateUtils.to_ql_dates([]) == []
+
+
+def test_payments_per_year():
+    assert DateUtils.payments_per_year(ql.Semiannual) == 2.0
+    assert DateUtils.payments_per_year("2W") == 26.0
+    assert DateUtils.payments_per_year("10D") == 36.5
+    assert DateUtils.payments_per_year("2Y") == 0.5
+    assert DateUtils.payments_per_year(ql.Period(0, ql.Months)) == 2.0
+
+
+def test_ensure_period_fast_path():
+    p = ql.Period(3, ql.Months)
+    assert DateUtils.ensure_period(p) is p
+    assert DateUtils.ensure_period_fast(p) is p
+    assert DateUtils.ensure_period(ql.Semiannual) == ql.Period(6, ql.Months)
+    assert DateUtils.ensure_period(object()) == ql.Period(1, ql.Years)
+
+
+# -----------------------------------------------------------------------------
+# fork_pool vs Numba parallel threads
+# -----------------------------------------------------------------------------
+@pytest.mark.skipif(not HAS_NUMBA, reason="no Numba threads without Numba")
+def test_jit_warmup_keeps_fork_pool_available():
+    code = (
+        "from callable_pricer._jit_warmup import warmup\n"
+        "from callable_pricer.engines._jit import parallel_threads_started\n"
+        "warmup()\n"
+        "assert not parallel_threads_started()\n"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=BASE_DIR, check=True)
+
+
+@pytest.mark.skipif(not HAS_NUMBA, reason="no Numba threads without Numba")
+def test_fork_pool_warns_after_numba_threads_started(caplog):
+    hw_lsmc._discount_step(np.ones(4), np.zeros(4, dtype=np.float32), 0.03, 0.04, 0.0)
+    with caplog.at_level(logging.WARNING, logger="callable_pricer.utils"):
+        assert fork_pool(2) is None
+    assert "serially" in caplog.text